@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 
+import codecs
+import fcntl
+import functools
 import logging
+import os
+import selectors
 import shutil
 import subprocess
 from collections.abc import Generator
@@ -35,23 +40,61 @@ def get_logger(name: str) -> logging.Logger:
     return logger
 
 
+@functools.lru_cache(maxsize=None)
 def check_command(command: str) -> Path:
     """This function returns a Path object for the location of the given command.
 
     A FileNotFoundError will be raised if the command executable was not found.
+    Found commands are cached; use check_command.cache_clear() to look them up again.
     """
-    command = shutil.which(command)
-    if not command:
+    location = shutil.which(command)
+    if not location:
         raise FileNotFoundError("The {} command was not found in PATH!".format(command))
-    return Path(command)
+    return Path(location)
 
 
-def run_command(command: list[str]) -> Generator[str, None, int]:
-    """Run an arbitrary command and yield output. The process return code is returned."""
+def run_command(
+    command: list[str], errors: list[str] | None = None, pipe_size: int = 0
+) -> Generator[str, None, int]:
+    """Run an arbitrary command and yield output lines. The process return code is returned.
+
+    Both stdout and stderr are read as output arrives so neither pipe can fill and stall the command.
+    If errors is given, lines written to stderr are appended to it.
+    If pipe_size is given, the stdout pipe is enlarged so the command can keep writing while lines are processed.
+    """
     with subprocess.Popen(
-        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
     ) as remote:
-        for line in iter(remote.stdout.readline, ""):
-            yield line
-        remote.stdout.close()
+        if pipe_size:
+            try:
+                fcntl.fcntl(remote.stdout, fcntl.F_SETPIPE_SZ, pipe_size)
+            except OSError:
+                # The size may exceed /proc/sys/fs/pipe-max-size; the default pipe still works
+                pass
+
+        decoders = {}
+        buffers = {}
+        with selectors.DefaultSelector() as selector:
+            for pipe in (remote.stdout, remote.stderr):
+                selector.register(pipe, selectors.EVENT_READ)
+                decoders[pipe] = codecs.getincrementaldecoder("utf-8")("replace")
+                buffers[pipe] = ""
+
+            while selector.get_map():
+                for key, _ in selector.select():
+                    pipe = key.fileobj
+                    chunk = os.read(key.fd, 65536)
+                    buffers[pipe] += decoders[pipe].decode(chunk, final=not chunk)
+                    *lines, buffers[pipe] = buffers[pipe].split("\n")
+
+                    # Flush any trailing partial line once the pipe is closed
+                    if not chunk:
+                        selector.unregister(pipe)
+                        if buffers[pipe]:
+                            lines += [buffers[pipe]]
+
+                    if pipe is remote.stdout:
+                        yield from lines
+                    elif errors is not None:
+                        errors.extend(lines)
         return remote.wait()
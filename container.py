@@ -1,15 +1,38 @@
 #!/usr/bin/env python3
 
+import io
 import json
 import subprocess
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import cached_property
+from itertools import pairwise
 from logging import Logger
+from operator import attrgetter
 from pathlib import Path
 from typing import ClassVar
 
 from common import check_command, get_logger
 
+# lxml is preferred for parsing chapters but is not required.
+try:
+    from lxml import etree as ET
+
+    # lxml can filter by tag while parsing, skipping everything else
+    _ITERPARSE_OPTIONS = {"tag": "ChapterAtom"}
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+    _ITERPARSE_OPTIONS = {}
+
+# orjson is preferred for decoding mkvmerge JSON but is not required.
+# orjson.JSONDecodeError is a subclass of json.JSONDecodeError.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 """
 References:
 - Matroska Spec
@@ -17,7 +40,7 @@ References:
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class AttachmentData:
     """A class to hold attachment data"""
 
@@ -71,25 +94,39 @@ class AttachmentData:
     # .ttc is for "collection"
     OCTET_STREAM: ClassVar[str] = "application/octet-stream"
 
+    # Content types that are always considered valid
+    _VALID_TYPES: ClassVar[frozenset[str]] = frozenset(IMG_TYPES + FONT_TYPES)
+
+    # File extensions that mark an OCTET_STREAM attachment as a font
+    _FONT_SUFFIXES: ClassVar[frozenset[str]] = frozenset([".ttf", ".otf", ".ttc"])
+
     id: int = -1
     type: str = None
     filename: Path = None
     description: str = ""
 
+    # This is computed once after initialization. See is_valid().
+    _valid: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._valid = self._compute_valid()
+
     def is_valid(self) -> bool:
         """Returns a bool for whether the instance is valid"""
-        if (
-            self.type.lower() in (AttachmentData.IMG_TYPES + AttachmentData.FONT_TYPES)
-            and self.filename
-        ):
+        return self._valid
+
+    def _compute_valid(self) -> bool:
+        if not self.type or not self.filename:
+            return False
+        content_type = self.type.lower()
+        if content_type in AttachmentData._VALID_TYPES:
             return True
-        elif self.type.lower() in [AttachmentData.OCTET_STREAM] and self.filename:
-            if self.filename.suffix.lower() in [".ttf", ".otf", ".ttc"]:
-                return True
+        elif content_type == AttachmentData.OCTET_STREAM:
+            return self.filename.suffix.lower() in AttachmentData._FONT_SUFFIXES
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class ChapterData:
     """A class to hold chapter data
 
@@ -108,18 +145,6 @@ class ChapterData:
     end_time: float = None
     duration: float = None
 
-    def __lt__(self, other: type["ChapterData"]) -> bool:
-        if self.start_time < other.start_time:
-            return True
-
-    def __gt__(self, other: type["ChapterData"]) -> bool:
-        if self.start_time > other.start_time:
-            return True
-
-    def __eq__(self, other: type["ChapterData"]) -> bool:
-        if self.start_time == other.start_time:
-            return True
-
     def is_valid(self) -> bool:
         """Returns a bool for whether the instance is valid"""
         if (
@@ -131,11 +156,7 @@ class ChapterData:
         return False
 
 
-# type function to prevent name conflicts with instance variable "type"
-_type_fn = type
-
-
-@dataclass
+@dataclass(slots=True)
 class StreamData:
     # These are defined as track types in Matroska spec.
     # Other types not included here are complex, logo, buttons, control, and metadata
@@ -164,6 +185,8 @@ class StreamData:
     LANG_THA: ClassVar[str] = "tha"
     LANG_UND: ClassVar[str] = "und"
 
+    _TYPES: ClassVar[frozenset[str]] = frozenset([VIDEO, AUDIO, SUBTITLES])
+
     type: str = None
     id: int = None
     uid: int = None
@@ -178,35 +201,24 @@ class StreamData:
     display_width: int = 0
     display_height: int = 0
 
-    def __eq__(self, other: _type_fn["StreamData"]) -> bool:
-        if self.type == other.type:
-            return self.bps == other.bps
-        return self.id == other.id
+    # This is computed once after initialization. See is_valid().
+    _valid: bool = field(default=False, init=False, repr=False, compare=False)
 
-    def __gt__(self, other: _type_fn["StreamData"]) -> bool:
-        if self.type == other.type:
-            return self.bps > other.bps
-        return self.id > other.id
-
-    def __lt__(self, other: _type_fn["StreamData"]) -> bool:
-        if self.type == other.type:
-            return self.bps < other.bps
-        return self.id < other.id
+    def __post_init__(self) -> None:
+        self._valid = self._compute_valid()
 
     def is_valid(self) -> bool:
         """Returns a bool for whether the instance is valid"""
+        return self._valid
 
+    def _compute_valid(self) -> bool:
         if not isinstance(self.id, int):
             return False
         else:
             if self.id < 0:
                 return False
 
-        if self.type not in [
-            StreamData.VIDEO,
-            StreamData.AUDIO,
-            StreamData.SUBTITLES,
-        ]:
+        if self.type not in StreamData._TYPES:
             return False
 
         if self.type == StreamData.VIDEO:
@@ -221,6 +233,11 @@ class StreamData:
         return True
 
 
+def _parse_timestamp(timestamp: str) -> float:
+    """Returns the seconds of a fixed width Matroska timestamp (HH:MM:SS.nnnnnnnnn)."""
+    return int(timestamp[0:2]) * 3600 + int(timestamp[3:5]) * 60 + float(timestamp[6:])
+
+
 class Container:
     """This is a container class for any video file."""
 
@@ -228,6 +245,11 @@ class Container:
         self.last_run_code: int = -1
         self.logger: Logger = get_logger(logger_name)
 
+        # The mkvtoolnix commands are located once per instance.
+        self._mkvmerge: Path = check_command("mkvmerge")
+        self._mkvextract: Path = check_command("mkvextract")
+        self._mkvpropedit: Path = check_command("mkvpropedit")
+
         # The following are reset by reload().
         # These are defined here so all atrributes can be observed.
         self.filename: Path = filename
@@ -236,9 +258,21 @@ class Container:
         self.title: str = None
         self.duration: int = None
         self.streams: list[StreamData] = []
-        self.chapters: list[ChapterData] = []
         self.attachments: list[AttachmentData] = []
 
+        # The number of chapters in the first edition as reported by mkvmerge.
+        # This matches the chapter numbers used when splitting by chapters.
+        self.chapter_count: int = 0
+
+        # Whether mkvmerge reported any chapter entries. The chapters property is only extracted if so.
+        self._has_chapters: bool = False
+
+        # Streams indexed by (type, language). This is rebuilt whenever streams are probed.
+        self._by_lang: dict[tuple[str, str], list[StreamData]] = {}
+
+        # Track edits queued within pending_edits(). None means edits are applied immediately.
+        self._pending_edits: list[tuple[int, str, str]] | None = None
+
         self.reload(filename)
 
     def __eq__(self, other: type["Container"]) -> bool:
@@ -261,42 +295,68 @@ class Container:
         return " ".join(rv)
 
     def reload(self, filename: Path):
-        self.logger.debug("Reload called for {}".format(filename.as_posix()))
+        self.logger.debug("Reload called for %s", filename.as_posix())
         self.filename: Path = filename
         if self.filename.is_file():
             self.size: int = self.filename.stat().st_size
         self.title = None
         self.duration = None
         self.streams = []
-        self.chapters = []
         self.attachments = []
+        self.chapter_count = 0
+        self._has_chapters = False
+        self.__dict__.pop("chapters", None)
+        self._by_lang = {}
         self._process(filename)
 
-    def _get_json(self, filename: Path, logger_name: str = "RIP") -> dict:
+    @cached_property
+    def chapters(self) -> list[ChapterData]:
+        """Chapters are always kept sorted by start time.
+
+        They are extracted with mkvextract on first use, and only if mkvmerge reported any entries.
+        """
+        if not self._has_chapters:
+            return []
+        chapters_xml = self._get_chapters(self.filename)
+        if not chapters_xml:
+            return []
+        return self._process_chapters_xml(chapters_xml)
+
+    def _get_json(self, filename: Path) -> dict:
         """Returns JSON dictionary from the mkvmerge -J command.
 
         If the JSON cannot be decoded, an empty dictionary is returned instead.
         """
-        logger = get_logger(logger_name)
-        mkvmerge = check_command("mkvmerge")
-        command = [mkvmerge.as_posix(), "-J", filename.as_posix()]
-        p = subprocess.Popen(
-            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
-        output, errors = p.communicate()
+        command = [self._mkvmerge.as_posix(), "-J", filename.as_posix()]
+        p = subprocess.run(command, capture_output=True)
+        output, errors = p.stdout, p.stderr
         if errors:
-            for line in errors:
+            for line in errors.decode().splitlines():
                 line = line.strip()
                 if line:
-                    logger.error(line)
+                    self.logger.error(line)
         if not output:
             raise ValueError("The mkvmerge JSON generation failed!")
         try:
-            json_output = json.loads(output)
+            json_output = json_loads(output)
             return json_output
         except json.JSONDecodeError:
             return {}
 
+    def _get_chapters(self, filename: Path) -> bytes:
+        """Returns the chapters XML from the mkvextract chapters command.
+
+        mkvextract writes the chapters to stdout when no output filename is given.
+        If the extraction fails, empty bytes are returned instead.
+        """
+        command = [self._mkvextract.as_posix(), filename.as_posix(), "chapters"]
+        p = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        self.last_run_code = p.returncode
+        if self.last_run_code != 0:
+            self.logger.error("Failure to extract chapters of %s!", filename)
+            return b""
+        return p.stdout
+
     def _process_json_container(self, json: dict) -> None:
         """Process container section of mkvmerge -J output"""
         container = json.get("container", {})
@@ -318,12 +378,14 @@ class Container:
         for track in tracks:
             track_properties = track.get("properties", {})
             stream_type = track.get("type")
-            pixel_width, pixel_height = map(
-                int, track_properties.get("pixel_dimensions", "0x0").split("x")
-            )
-            display_width, display_height = map(
-                int, track_properties.get("display_dimensions", "0x0").split("x")
-            )
+            pixel_width = pixel_height = display_width = display_height = 0
+            if stream_type == StreamData.VIDEO:
+                pixel_width, pixel_height = map(
+                    int, track_properties.get("pixel_dimensions", "0x0").split("x")
+                )
+                display_width, display_height = map(
+                    int, track_properties.get("display_dimensions", "0x0").split("x")
+                )
 
             stream_info = StreamData(
                 id=int(track.get("id")),
@@ -343,102 +405,101 @@ class Container:
             if stream_info.is_valid():
                 self.streams += [stream_info]
 
+        self._by_lang = {}
+        for stream in self.streams:
+            self._by_lang.setdefault((stream.type, stream.language), []).append(stream)
+
     def _process_json_attachments(self, json: dict) -> None:
         """Process attachments section of mkvmerge -J output"""
         attachments = json.get("attachments", [])
         for attachment in attachments:
             id = int(attachment.get("id"))
+            file_name = attachment.get("file_name")
             attachment_info = AttachmentData(
                 id=id,
                 type=attachment.get("content_type"),
-                filename=attachment.get("file_name"),
+                filename=Path(file_name) if file_name else None,
                 description=attachment.get("description"),
             )
             if attachment_info.is_valid():
                 self.attachments += [attachment_info]
 
+    def _process_json_chapters(self, json: dict) -> None:
+        """Process chapters section of mkvmerge -J output
+
+        mkvmerge only reports the number of chapter entries for each edition.
+        The chapters themselves are extracted later by the chapters property, if there are any entries.
+        """
+        editions = json.get("chapters", [])
+        self.chapter_count = editions[0].get("num_entries", 0) if editions else 0
+        self._has_chapters = any(edition.get("num_entries", 0) for edition in editions)
+
     def _detect_chapter_gaps(self) -> bool:
         """
         This function returns True if there is a gap between any two consecutive chapters.
+
+        The chapters are already sorted by start time when they are processed.
         """
-        previous_chapter = None
-        for chapter in sorted(self.chapters):
-            if previous_chapter:
-                delta = chapter.start_time - previous_chapter.end_time
-                if delta > 0:
-                    return True
-            previous_chapter = chapter
+        for previous_chapter, chapter in pairwise(self.chapters):
+            if chapter.start_time - previous_chapter.end_time > 0:
+                return True
         return False
 
-    def _get_chapters(self) -> None:
+    def _process_chapters_xml(self, chapters_xml: bytes) -> list[ChapterData]:
         """
-        Get chapters using mkvextract and process the file.
+        Process the chapters XML from mkvextract and return the chapters sorted by start time.
         """
         try:
-            mkvextract = check_command("mkvextract")
-            chapters_filename = Path("{}.chapters.xml".format(self.filename.name))
-            command = [
-                mkvextract.as_posix(),
-                self.filename.as_posix(),
-                "chapters",
-                chapters_filename.as_posix(),
-            ]
-            self.last_run_code = subprocess.check_call(
-                command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-            )
-            tree = ET.parse(chapters_filename)
             chapters = []
-            root = tree.getroot()
-            for chapter_atom in root.iter("ChapterAtom"):
+            # Stream parse the chapters so each ChapterAtom is freed once processed
+            for _, chapter_atom in ET.iterparse(
+                io.BytesIO(chapters_xml), events=("end",), **_ITERPARSE_OPTIONS
+            ):
+                if chapter_atom.tag != "ChapterAtom":
+                    continue
                 chapter = ChapterData()
-                for child in chapter_atom.iter():
-                    match child.tag:
-                        case "ChapterUID":
-                            chapter.id = int(child.text.strip())
-                            chapter.index = len(chapters) + 1
-                        case "ChapterTimeStart":
-                            hours, minutes, seconds = map(float, child.text.split(":"))
-                            seconds += (hours * 3600) + (minutes * 60)
-                            chapter.start_time = seconds
-                        case "ChapterTimeEnd":
-                            hours, minutes, seconds = map(float, child.text.split(":"))
-                            seconds += (hours * 3600) + (minutes * 60)
-                            chapter.end_time = seconds
-                        case "ChapterString":
-                            chapter.title = child.text.strip()
-                chapter.duration = chapter.end_time - chapter.start_time
+                uid = chapter_atom.findtext("ChapterUID")
+                if uid:
+                    chapter.id = int(uid.strip())
+                    chapter.index = len(chapters) + 1
+                start_time = chapter_atom.findtext("ChapterTimeStart")
+                if start_time:
+                    chapter.start_time = _parse_timestamp(start_time)
+                end_time = chapter_atom.findtext("ChapterTimeEnd")
+                if end_time:
+                    chapter.end_time = _parse_timestamp(end_time)
+                title = chapter_atom.findtext("ChapterDisplay/ChapterString")
+                if title:
+                    chapter.title = title.strip()
+                if chapter.start_time is not None and chapter.end_time is not None:
+                    chapter.duration = chapter.end_time - chapter.start_time
                 if chapter.is_valid():
                     chapters += [chapter]
-            chapters.sort()
-            self.chapters = chapters
-        except subprocess.CalledProcessError:
-            self.logger.error(
-                "Failure to extract chapters of {}!".format(self.filename)
-            )
-        except FileNotFoundError:
-            self.logger.error(
-                "Failure to write chapters file for {}".format(self.filename)
-            )
-        finally:
-            chapters_filename.unlink(missing_ok=True)
+                chapter_atom.clear()
+            chapters.sort(key=attrgetter("start_time"))
+            return chapters
+        except ET.ParseError:
+            self.logger.error("Failure to parse chapters of %s!", self.filename)
+            return []
 
     def _process(self, filename: Path):
-        "Process JSON for filename."
+        """Probe filename with mkvmerge.
+
+        Chapters are not extracted here; see the chapters property.
+        """
         _json = self._get_json(filename)
         self._process_json_container(_json)
         self._process_json_tracks(_json)
         self._process_json_attachments(_json)
-        self._get_chapters()
-        self.is_valid()
+        self._process_json_chapters(_json)
 
     def set_title(self, title: str) -> None:
         """
         Set title for a given MKV file
         """
         title = title.strip()
-        mkvpropedit = check_command("mkvpropedit")
         command = [
-            mkvpropedit.as_posix(),
+            self._mkvpropedit.as_posix(),
             self.filename.as_posix(),
             "--edit",
             "info",
@@ -451,7 +512,7 @@ class Container:
             )
             self.title = title
         except subprocess.CalledProcessError:
-            self.logger.error("Failed to set title for {}".format(self.filename))
+            self.logger.error("Failed to set title for %s", self.filename)
 
     def remux_by_language(
         self, audio_languages: list[str], subtitle_languages: list[str]
@@ -462,82 +523,190 @@ class Container:
         Streams not specified by any language will be removed from output except for "undetermined", which is always kept unless all specified languages are available.
         If all specified languages are available, it is assumed that "undetermined" streams are not wanted.
         """
+        audio_streams, subtitles_streams = self._kept_streams(
+            *self._filter_languages(audio_languages, subtitle_languages)
+        )
 
-        mkvmerge = check_command("mkvmerge")
+        # Skip rewriting the file if every stream would be kept anyway
+        if self._keeps_all_streams(audio_streams, subtitles_streams):
+            self.logger.debug(
+                "No streams would be removed from %s. Skipping remux.", self.filename
+            )
+            self.last_run_code = 0
+            return
+
+        self._remux(self._track_options(audio_streams, subtitles_streams))
+
+    def remux_and_set_defaults(
+        self,
+        audio_languages: list[str],
+        subtitle_languages: list[str],
+        default_audio_language: str,
+        default_subtitle_language: str = "",
+    ) -> None:
+        """Filter streams by language and set the default streams in a single pass.
+
+        The streams are filtered as in remux_by_language.
+        One audio stream is made default, preferring default_audio_language.
+        A subtitles stream of default_subtitle_language is made default if given; Otherwise no subtitles are default.
+        All other kept audio and subtitles streams are made not default.
+        The default flags are written by the same mkvmerge call as the remux.
+        If no streams would be removed, the flags are edited in place (using mkvpropedit) instead.
+        """
+        # These are the streams that will remain after remuxing
+        audio_streams, subtitles_streams = self._kept_streams(
+            *self._filter_languages(audio_languages, subtitle_languages)
+        )
+
+        default_streams = [
+            self._pick_default_stream(
+                StreamData.AUDIO,
+                default_audio_language,
+                [x for x in audio_streams if x.language == default_audio_language],
+                audio_streams,
+            )
+        ]
+        if default_subtitle_language:
+            default_streams += [
+                self._pick_default_stream(
+                    StreamData.SUBTITLES,
+                    default_subtitle_language,
+                    [
+                        x
+                        for x in subtitles_streams
+                        if x.language == default_subtitle_language
+                    ],
+                    [],
+                )
+            ]
+
+        if self._keeps_all_streams(audio_streams, subtitles_streams):
+            self.logger.debug(
+                "No streams would be removed from %s. Skipping remux.", self.filename
+            )
+            self.last_run_code = 0
+            with self.pending_edits():
+                for stream in audio_streams + subtitles_streams:
+                    default = stream in default_streams
+                    if stream.default != default:
+                        self._set_default_flag(stream, default)
+            return
+
+        options = self._track_options(audio_streams, subtitles_streams)
+        for stream in audio_streams + subtitles_streams:
+            options += [
+                "--default-track-flag",
+                "{}:{}".format(stream.id, int(stream in default_streams)),
+            ]
+        self._remux(options)
+
+    def _filter_languages(
+        self, audio_languages: list[str], subtitle_languages: list[str]
+    ) -> tuple[list[str], list[str]]:
+        """Returns the audio and subtitle languages to keep when remuxing"""
 
         # Always add "und" type to filter if not all languages are present
         # This ensures if the missing language is actually "und", it is kept
-        if StreamData.LANG_UND not in audio_languages:
-            und_flag = False
-            for language in audio_languages:
-                if not [
-                    x
-                    for x in self.streams
-                    if x.language == language and x.type == StreamData.AUDIO
-                ]:
-                    und_flag = True
-                    break
-            if und_flag:
-                audio_languages += [StreamData.LANG_UND]
-                self.logger.warning("Undetermined audio streams will be included.")
-
-        if StreamData.LANG_UND not in subtitle_languages:
-            und_flag = False
-            for language in subtitle_languages:
-                if not [
-                    x
-                    for x in self.streams
-                    if x.language == language and x.type == StreamData.SUBTITLES
-                ]:
-                    und_flag = True
-                    break
-            if und_flag:
-                subtitle_languages += [StreamData.LANG_UND]
-                self.logger.warning("Undetermined subtitle streams will be included.")
+        # The given lists are copied rather than extended so the caller's lists are not changed
+        if StreamData.LANG_UND not in audio_languages and any(
+            (StreamData.AUDIO, language) not in self._by_lang
+            for language in audio_languages
+        ):
+            audio_languages = [*audio_languages, StreamData.LANG_UND]
+            self.logger.warning("Undetermined audio streams will be included.")
+
+        if StreamData.LANG_UND not in subtitle_languages and any(
+            (StreamData.SUBTITLES, language) not in self._by_lang
+            for language in subtitle_languages
+        ):
+            subtitle_languages = [*subtitle_languages, StreamData.LANG_UND]
+            self.logger.warning("Undetermined subtitle streams will be included.")
+
+        if not audio_languages:
+            self.logger.warning(
+                "Specified audio languages not available! Audio streams will not be removed!"
+            )
+
+        return audio_languages, subtitle_languages
+
+    def _kept_streams(
+        self, audio_languages: list[str], subtitle_languages: list[str]
+    ) -> tuple[list[StreamData], list[StreamData]]:
+        """Returns the audio and subtitles streams to keep for the given languages
+
+        Add audio streams that match specified languages
+        Add all audio streams if there are no matches
+        Add subtitles only if they match specified language, otherwise add none
+        """
+        audio_streams = [
+            x
+            for x in self.streams
+            if x.type == StreamData.AUDIO and x.language in audio_languages
+        ]
+        if not audio_streams:
+            audio_streams = [x for x in self.streams if x.type == StreamData.AUDIO]
+        subtitles_streams = [
+            x
+            for x in self.streams
+            if x.type == StreamData.SUBTITLES and x.language in subtitle_languages
+        ]
+        return audio_streams, subtitles_streams
+
+    def _keeps_all_streams(
+        self, audio_streams: list[StreamData], subtitles_streams: list[StreamData]
+    ) -> bool:
+        """Returns a bool for whether the given streams are every audio and subtitles stream"""
+        return len(audio_streams) + len(subtitles_streams) == sum(
+            1
+            for x in self.streams
+            if x.type == StreamData.AUDIO or x.type == StreamData.SUBTITLES
+        )
+
+    @staticmethod
+    def _track_options(
+        audio_streams: list[StreamData], subtitles_streams: list[StreamData]
+    ) -> list[str]:
+        """Returns the mkvmerge options that keep only the given audio and subtitles streams
+
+        Streams are selected by track ID as reported by mkvmerge -J, so mkvmerge does not match languages again.
+        """
+        return [
+            *(
+                ("--audio-tracks", ",".join(str(x.id) for x in audio_streams))
+                if audio_streams
+                else ("--no-audio",)
+            ),
+            *(
+                ("--subtitle-tracks", ",".join(str(x.id) for x in subtitles_streams))
+                if subtitles_streams
+                else ("--no-subtitles",)
+            ),
+        ]
+
+    def _remux(self, options: list[str]) -> None:
+        """Remux the file with the given mkvmerge options and replace the original (using mkvmerge)"""
 
         # Set output filename for remuxed output
         output_filename = self.filename.parent.joinpath(
-            self.filename.stem + ".remuxed" + self.filename.suffix
+            f"{self.filename.stem}.remuxed{self.filename.suffix}"
         )
 
-        # Setup remuxing command with output filename
         command = [
-            mkvmerge.as_posix(),
+            self._mkvmerge.as_posix(),
             "-o",
             output_filename.as_posix(),
-        ]
-        # Add audio streams that match specified languages
-        # Add all audio streams if there are no matches
-        if audio_languages:
-            command += [
-                "--audio-tracks",
-                "{}".format(",".join(audio_languages)),
-            ]
-        else:
-            self.logger.warning(
-                "Specified audio languages not available! Audio streams will not be removed!"
-            )
-        # Add subtitles only if they match specified language, otherwise add none
-        if subtitle_languages:
-            command += [
-                "--subtitle-tracks",
-                "{}".format(",".join(subtitle_languages)),
-            ]
-        else:
-            command += ["--no-subtitles"]
-        # Add input filename
-        command += [
+            *options,
             self.filename.as_posix(),
         ]
 
         # Remux
-        self.logger.debug("Raw command: {}".format(" ".join(command)))
+        self.logger.debug("Raw command: %s", command)
         try:
             self.last_run_code = subprocess.check_call(
                 command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
             )
         except subprocess.CalledProcessError:
-            self.logger.error("Failure to remux {}!".format(self.filename))
+            self.logger.error("Failure to remux %s!", self.filename)
             raise
 
         # Delete original file and rename remuxed file to match original
@@ -547,6 +716,44 @@ class Container:
             filename = output_filename.rename(self.filename.resolve())
             self.reload(filename)
 
+    def _pick_default_stream(
+        self,
+        stream_type: str,
+        language: str,
+        streams: list[StreamData],
+        fallback: list[StreamData],
+    ) -> StreamData | None:
+        """Returns the stream to set as default from streams of the desired language.
+
+        If there are no such streams, an arbitrary stream from fallback is returned (if any).
+        """
+
+        # Log error for no streams of desired language
+        if not streams:
+            self.logger.error(
+                "Failure to set default %s stream as %s! Nothing to set!",
+                stream_type,
+                language,
+            )
+
+        # Reset streams if "something" needs to be set for the stream type
+        if not streams and fallback:
+            streams = fallback
+            self.logger.warning(
+                "Setting arbitrary stream as default %s stream!", stream_type
+            )
+
+        if not streams:
+            return None
+
+        # If setting subtitles, sort such that the first stream is the "largest" stream
+        # This is to avoid setting a subtitles stream with very few subttiles as default
+        # E.g. There are subtitles for a show "opening" only instead of the full episode
+        if stream_type == StreamData.SUBTITLES:
+            streams = sorted(streams, key=lambda x: x.frames, reverse=True)
+
+        return streams[0]
+
     def _set_default_stream_by_language(
         self, language: str, stream_type: str, default_required=False
     ) -> None:
@@ -556,64 +763,102 @@ class Container:
         """
 
         # Get streams of stream type that match the right language
-        streams = [
-            x for x in self.streams if x.type == stream_type and x.language == language
-        ]
+        streams = self._by_lang.get((stream_type, language), [])
+        fallback = []
+        if default_required:
+            fallback = [x for x in self.streams if x.type == stream_type]
 
-        # Log error for no streams of desired language
-        if not streams:
-            self.logger.error(
-                "Failure to set default {} stream as {}! Nothing to set!".format(
-                    stream_type, language
-                )
+        # If a stream is available to mark as default, do it
+        stream = self._pick_default_stream(stream_type, language, streams, fallback)
+        if stream is None:
+            return
+
+        if stream.default:
+            self.logger.debug(
+                "Skipping setting default stream. Stream is already default."
+            )
+            return
+        if self._set_default_flag(stream, True):
+            self.logger.debug(
+                "The %s stream id %s was set as default.", stream.type, stream.id
             )
+        else:
+            self.logger.error("Failure to set default %s stream!", stream_type)
 
-        # Reset streams if "something" needs to be set for the stream type
-        if not streams and default_required:
-            streams = [x for x in self.streams if x.type == stream_type]
-            self.logger.warning(
-                "Setting arbitrary stream as default {} stream!".format(stream_type)
+    def apply_edits(self, edits: list[tuple[int, str, str]]) -> bool:
+        """Apply track property edits with a single mkvpropedit call.
+
+        Each edit is a tuple of (track uid, property name, value).
+        Default flag edits are mirrored onto the streams in memory instead of probing the file again.
+        The file is only reloaded if mkvpropedit fails or other properties were edited.
+        Returns True if the edits were applied successfully.
+        """
+        if not edits:
+            return True
+        command = [self._mkvpropedit.as_posix(), self.filename.as_posix()]
+        for uid, name, value in edits:
+            command += [
+                "--edit",
+                "track:={}".format(uid),
+                "--set",
+                "{}={}".format(name, value),
+            ]
+        self.logger.debug("Raw command: %s", command)
+        try:
+            self.last_run_code = subprocess.check_call(
+                command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
             )
+        except subprocess.CalledProcessError:
+            self.logger.error("Failure to edit tracks of %s!", self.filename)
+            # Reload to recover the actual state of the file
+            self.reload(self.filename)
+            return False
 
-        # If a stream is available to mark as default, do it
-        if streams:
-            # If setting subtitles, sort such that the first stream is the "largest" stream
-            # This is to avoid setting a subtitles stream with very few subttiles as default
-            # E.g. There are subtitles for a show "opening" only instead of the full episode
-            if stream_type == StreamData.SUBTITLES:
-                streams.sort(key=lambda x: x.frames, reverse=True)
-
-            stream = streams[0]
-            if stream.default:
-                self.logger.debug(
-                    "Skipping setting default stream. Stream is already default."
-                )
-                return
-            try:
-                mkvpropedit = check_command("mkvpropedit")
-                command = [
-                    mkvpropedit.as_posix(),
-                    self.filename.as_posix(),
-                    "--edit",
-                    "track:={}".format(stream.uid),
-                    "--set",
-                    "flag-default=1",
-                ]
-                self.logger.debug("Raw command: {}".format(" ".join(command)))
-                self.last_run_code = subprocess.check_call(
-                    command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-                )
-                self.logger.debug(
-                    "The {} stream id {} was set as default.".format(
-                        stream.type, stream.id
-                    )
-                )
-            except subprocess.CalledProcessError:
-                self.logger.error(
-                    "Failure to set default {} stream!".format(stream_type)
-                )
-            finally:
-                self.reload(self.filename)
+        if any(name != "flag-default" for _, name, _ in edits):
+            self.reload(self.filename)
+            return True
+
+        streams = {x.uid: x for x in self.streams}
+        for uid, _, value in edits:
+            if uid in streams:
+                streams[uid].default = value == "1"
+        self.size = self.filename.stat().st_size
+        return True
+
+    @contextmanager
+    def pending_edits(self) -> Generator["Container", None, None]:
+        """Queue track edits made within the context and apply them together on exit.
+
+        Streams are updated in memory as edits are queued, so later calls see the queued state.
+        Nested contexts share the outer queue; only the outermost context applies the edits.
+        """
+        if self._pending_edits is not None:
+            yield self
+            return
+
+        self._pending_edits = []
+        try:
+            yield self
+        finally:
+            self.flush()
+
+    def flush(self) -> bool:
+        """Apply any queued track edits. Returns True if the edits were applied successfully."""
+        edits = self._pending_edits or []
+        self._pending_edits = None
+        return self.apply_edits(edits)
+
+    def _set_default_flag(self, stream: StreamData, default: bool) -> bool:
+        """Set the default flag of a stream, or queue the edit if edits are pending.
+
+        Returns False if the edit failed.
+        """
+        edit = (stream.uid, "flag-default", "1" if default else "0")
+        if self._pending_edits is None:
+            return self.apply_edits([edit])
+        self._pending_edits += [edit]
+        stream.default = default
+        return True
 
     def set_preferred_audio_by_language(
         self, language: str, default_required=True
@@ -642,25 +887,9 @@ class Container:
 
         for stream in audio_streams:
             if stream.default:
-                try:
-                    mkvpropedit = check_command("mkvpropedit")
-                    command = [
-                        mkvpropedit.as_posix(),
-                        self.filename.as_posix(),
-                        "--edit",
-                        "track:={}".format(stream.uid),
-                        "--set",
-                        "flag-default=0",
-                    ]
-                    self.logger.debug("Raw command: {}".format(" ".join(command)))
-                    self.last_run_code = subprocess.check_call(
-                        command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-                    )
-                except subprocess.CalledProcessError:
+                if not self._set_default_flag(stream, False):
                     self.logger.error("Failure to clear default audio stream!")
-                finally:
-                    self.reload(self.filename)
-                    break
+                break
 
     def clear_default_subtitles(self) -> None:
         """Set no subtitles as default."""
@@ -671,25 +900,9 @@ class Container:
 
         for stream in subtitles_streams:
             if stream.default:
-                try:
-                    mkvpropedit = check_command("mkvpropedit")
-                    command = [
-                        mkvpropedit.as_posix(),
-                        self.filename.as_posix(),
-                        "--edit",
-                        "track:={}".format(stream.uid),
-                        "--set",
-                        "flag-default=0",
-                    ]
-                    self.logger.debug("Raw command: {}".format(" ".join(command)))
-                    self.last_run_code = subprocess.check_call(
-                        command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-                    )
-                except subprocess.CalledProcessError:
+                if not self._set_default_flag(stream, False):
                     self.logger.error("Failure to clear default subtitles stream!")
-                finally:
-                    self.reload(self.filename)
-                    break
+                break
 
     def is_valid(self) -> bool:
         """Validate instance to ensure minimum attributes are set.
@@ -700,20 +913,42 @@ class Container:
         )
         return self._valid
 
-    def split(self, chapter_indices: list[int], basename: str = "") -> None:
+    def split(
+        self,
+        chapter_indices: list[int] | None = None,
+        basename: str = "",
+        all_chapters: bool = False,
+    ) -> None:
         """Split file into separate videos by chapter indices (using mkvmerge).
+        If all_chapters is set, the file is split at every chapter and chapter_indices is ignored.
         If basename is not set, basename will be based on the input filename.
         The output directory is the location of the input filename.
         """
+        if not all_chapters and not chapter_indices:
+            self.logger.debug("No chapters were given to split %s.", self.filename)
+            self.last_run_code = 0
+            return
+
+        if self.chapter_count <= 1:
+            self.logger.info(
+                "%s has too few chapters to split. Skipping split.", self.filename
+            )
+            self.last_run_code = 0
+            return
+
+        if all_chapters:
+            split_chapters = "all"
+        else:
+            split_chapters = ",".join(map(str, chapter_indices))
+
         if not basename:
             basename = self.filename.stem
-        mkvmerge = check_command("mkvmerge")
         command = [
-            mkvmerge.as_posix(),
+            self._mkvmerge.as_posix(),
             "-o",
             "{}-%02d{}".format(basename, self.filename.suffix),
             "--split",
-            "chapters:{}".format(",".join(map(str, chapter_indices))),
+            "chapters:{}".format(split_chapters),
             self.filename.as_posix(),
         ]
         try:
@@ -724,4 +959,4 @@ class Container:
                 cwd=self.filename.parent.as_posix(),
             )
         except subprocess.CalledProcessError:
-            self.logger.error("Failure to split {}!".format(self.filename))
+            self.logger.error("Failure to split %s!", self.filename)
@@ -12,20 +12,33 @@ References:
 import argparse
 import fcntl
 import os
+import stat
+import subprocess
+from collections.abc import Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from operator import attrgetter
 from pathlib import Path
 from typing import ClassVar
 
+from common import check_command
+
+
+def _ioctl(fd: int, command: int, arg: int = 0) -> int:
+    """This function wraps the function fcntl.ioctl for an already open fd."""
+    return fcntl.ioctl(fd, command, arg)
+
 
 def fd_command(filename: Path, command: int, arg: int = 0) -> int:
     """This function wraps the function fcntl.ioctl and returns the status.
 
     This is to allow a device Path object to be specified directly.
     """
-    status = None
     fd = os.open(filename.as_posix(), os.O_NONBLOCK)
-    status = fcntl.ioctl(fd, command, arg)
-    os.close(fd)
-    return status
+    try:
+        return _ioctl(fd, command, arg)
+    finally:
+        os.close(fd)
 
 
 class Disc:
@@ -52,6 +65,22 @@ class Disc:
     CDS_XA_2: ClassVar[int] = 104
     CDS_MIXED: ClassVar[int] = 105
 
+    _VALID_DRIVE_STATUS: ClassVar[frozenset[int]] = frozenset(
+        {CDS_NO_INFO, CDS_NO_DISC, CDS_TRAY_OPEN, CDS_DRIVE_NOT_READY, CDS_DISC_OK}
+    )
+    _VALID_DISC_STATUS: ClassVar[frozenset[int]] = frozenset(
+        {
+            CDS_AUDIO,
+            CDS_DATA_1,
+            CDS_DATA_2,
+            CDS_XA_1,
+            CDS_XA_2,
+            CDS_MIXED,
+            CDS_NO_DISC,
+            CDS_NO_INFO,
+        }
+    )
+
     CDS_DRIVE_STATUS: ClassVar[dict[int, str]] = {}
     CDS_DRIVE_STATUS[0] = "No Info"
     CDS_DRIVE_STATUS[1] = "No Disc"
@@ -68,147 +97,265 @@ class Disc:
     CDS_COLOR_DEF[104] = "XA Data (Green Book, Mode 2 Form 2)"
     CDS_COLOR_DEF[105] = "Mixed"
 
-    def __init__(self, filename: Path):
+    def __init__(self, filename: Path, _rdev: int | None = None, lazy: bool = False):
         self.filename: Path = filename
+
+        # The device number may be passed in when it is already known (see query_all_drives)
+        self._rdev: int | None = _rdev
         self.valid: bool = False
-        self.drive_status: int = self.CDS_NO_INFO
-        self.disc_status: int = self.CDS_NO_DISC
-        self.query()
+
+        # The statuses are read by query(); Accessing them through the properties
+        # will query the drive first if it has not been queried yet.
+        self._queried: bool = False
+        self._drive_status: int = self.CDS_NO_INFO
+        self._disc_status: int = self.CDS_NO_DISC
+
+        # Path lookups are cached since they are used for every comparison
+        self._is_symlink: bool = self.filename.is_symlink()
+        self._abs: Path | None = None
+        if self._is_symlink:
+            self._abs = self.filename.absolute()
+        self._resolved: Path = self.filename.resolve()
+
+        # Symbolic links sort ahead of other devices
+        self._sort_key: tuple[bool, Path] = (
+            not self._is_symlink,
+            self._abs if self._is_symlink else self.filename,
+        )
+
+        # This is built on first use and reset whenever the drive is queried
+        self._repr: str | None = None
+
+        # When lazy, only the validity is checked until the statuses are needed.
+        if lazy:
+            self.valid = self._check_valid()
+        else:
+            self.query()
 
     def __repr__(self) -> str:
+        if self._repr is not None:
+            return self._repr
+
         link = ""
-        if self.filename.is_symlink():
-            link = " ({})".format(self.filename.absolute())
-        rv = ""
-        rv += "Filename: {}{}\n".format(self.filename.resolve(), link)
-        rv += "Valid: {}\n".format(self.valid)
-        rv += "Drive_Status: {}\n".format(self.drive_status)
+        if self._is_symlink:
+            link = f" ({self._abs})"
 
         status = self.disc_status
         if status in Disc.CDS_COLOR_DEF:
             status = Disc.CDS_COLOR_DEF[status]
-        rv += "Disc_Status: {}".format(status)
 
-        return rv
+        self._repr = (
+            f"Filename: {self._resolved}{link}\n"
+            f"Valid: {self.valid}\n"
+            f"Drive_Status: {self.drive_status}\n"
+            f"Disc_Status: {status}"
+        )
+        return self._repr
 
     def __lt__(self, other: type["Disc"]) -> bool:
-        if self.filename.is_symlink() and other.filename.is_symlink():
-            return self.filename.absolute() < other.filename.absolute()
-        elif self.filename.is_symlink():
-            return True
-        else:
-            return self.filename < other.filename
+        return self._sort_key < other._sort_key
 
     def __gt__(self, other: type["Disc"]) -> bool:
-        if self.filename.is_symlink() and other.filename.is_symlink():
-            return self.filename.absolute() > other.filename.absolute()
-        elif self.filename.is_symlink():
-            return True
-        else:
-            return self.filename > other.filename
+        return self._sort_key > other._sort_key
 
     def __eq__(self, other: type["Disc"]) -> bool:
-        if self.filename.is_symlink() and other.filename.is_symlink():
-            return self.filename.absolute() == other.filename.absolute()
-        elif self.filename.is_symlink():
-            return True
-        else:
-            return self.filename == other.filename
+        return self._sort_key == other._sort_key
+
+    @property
+    def drive_status(self) -> int:
+        if not self._queried:
+            self.query()
+        return self._drive_status
+
+    @property
+    def disc_status(self) -> int:
+        if not self._queried:
+            self.query()
+        return self._disc_status
 
     def query(self) -> None:
-        if self.filename.exists():
-            self.valid = self.validate_disc_device(self.filename)
+        self._repr = None
+        self._queried = True
+        self.valid = self._check_valid()
 
         if self.valid:
-            self.drive_status = self.get_drive_status(self.filename)
-            self.disc_status = self.get_disc_status(self.filename)
+            # Both statuses are read through a single open of the device
+            with self._with_fd() as fd:
+                self._drive_status = self._check_drive_status(
+                    _ioctl(fd, Disc.CDROM_DRIVE_STATUS)
+                )
+                self._disc_status = self._check_disc_status(
+                    _ioctl(fd, Disc.CDROM_DISC_STATUS)
+                )
+
+    def _check_valid(self) -> bool:
+        if self._rdev is not None:
+            return os.major(self._rdev) == Disc.MAJOR_DEV_SCSI_CDROM
+        if self.filename.exists():
+            return self.validate_disc_device(self.filename)
+        return False
+
+    def _open(self) -> int:
+        return os.open(self.filename.as_posix(), os.O_NONBLOCK)
+
+    @contextmanager
+    def _with_fd(self) -> Generator[int, None, None]:
+        fd = self._open()
+        try:
+            yield fd
+        finally:
+            os.close(fd)
+
+    @contextmanager
+    def session(self) -> Generator[type["_DiscFd"], None, None]:
+        """Open the device once for several tray commands.
+
+        The single-shot methods (eject_tray, lock_tray, etc.) each open the device.
+        """
+        with self._with_fd() as fd:
+            yield _DiscFd(fd)
 
     def name(self) -> Path:
-        if self.filename.is_symlink():
+        if self._is_symlink:
             return self.filename
-        return self.filename.resolve()
+        return self._resolved
+
+    def get_volume_id(self) -> str:
+        """Return an identifier for the inserted disc built from its filesystem UUID and label.
+
+        The device is probed directly (blkid -p) so a swapped disc is not reported from the blkid cache.
+
+        An empty string is returned if blkid is unavailable or no filesystem is found.
+        """
+        try:
+            blkid = check_command("blkid")
+        except FileNotFoundError:
+            return ""
+
+        result = subprocess.run(
+            [blkid, "-p", "-o", "export", self.filename],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            return ""
+
+        fields = dict(
+            line.split("=", 1) for line in result.stdout.splitlines() if "=" in line
+        )
+        uuid = fields.get("UUID", "")
+        label = fields.get("LABEL", "")
+        if not uuid and not label:
+            return ""
+        return "{}:{}".format(uuid, label)
 
     def eject_tray(self) -> int:
-        status = fd_command(self.filename, Disc.CDROM_EJECT)
-        return status
+        with self._with_fd() as fd:
+            return _ioctl(fd, Disc.CDROM_EJECT)
 
     def close_tray(self) -> int:
-        status = fd_command(self.filename, Disc.CDROM_CLOSETRAY)
-        return status
+        with self._with_fd() as fd:
+            return _ioctl(fd, Disc.CDROM_CLOSETRAY)
 
     def unlock_tray(self) -> int:
-        status = fd_command(self.filename, Disc.CDROM_LOCKDOOR, 0)
-        return status
+        with self._with_fd() as fd:
+            return _ioctl(fd, Disc.CDROM_LOCKDOOR, 0)
 
     def lock_tray(self) -> int:
-        status = fd_command(self.filename, Disc.CDROM_LOCKDOOR, 1)
-        return status
+        with self._with_fd() as fd:
+            return _ioctl(fd, Disc.CDROM_LOCKDOOR, 1)
 
     @staticmethod
     def validate_disc_device(filename: Path) -> bool:
-        rdev = Path(filename).stat().st_rdev
+        rdev = filename.stat().st_rdev
         if os.major(rdev) == Disc.MAJOR_DEV_SCSI_CDROM:
             return True
         return False
 
     @staticmethod
     def get_drive_status(filename: Path) -> int:
-        status = fd_command(filename, Disc.CDROM_DRIVE_STATUS)
-        match status:
-            case (
-                Disc.CDS_NO_INFO
-                | Disc.CDS_NO_DISC
-                | Disc.CDS_TRAY_OPEN
-                | Disc.CDS_DRIVE_NOT_READY
-                | Disc.CDS_DISC_OK
-            ):
-                return status
-            case _:
-                raise ValueError("Unknown drive status! --> {}".format(status))
+        return Disc._check_drive_status(fd_command(filename, Disc.CDROM_DRIVE_STATUS))
 
     @staticmethod
     def get_disc_status(filename: Path) -> int:
-        status = fd_command(filename, Disc.CDROM_DISC_STATUS)
-        match status:
-            case (
-                Disc.CDS_AUDIO
-                | Disc.CDS_DATA_1
-                | Disc.CDS_DATA_2
-                | Disc.CDS_XA_1
-                | Disc.CDS_XA_2
-                | Disc.CDS_MIXED
-                | Disc.CDS_NO_DISC
-                | Disc.CDS_NO_INFO
-            ):
-                return status
-
-            case _:
-                raise ValueError("Unknown disc status --> {}".format(status))
+        return Disc._check_disc_status(fd_command(filename, Disc.CDROM_DISC_STATUS))
+
+    @staticmethod
+    def _check_drive_status(status: int) -> int:
+        if status not in Disc._VALID_DRIVE_STATUS:
+            raise ValueError("Unknown drive status! --> {}".format(status))
+        return status
+
+    @staticmethod
+    def _check_disc_status(status: int) -> int:
+        if status not in Disc._VALID_DISC_STATUS:
+            raise ValueError("Unknown disc status --> {}".format(status))
+        return status
 
     @staticmethod
     def query_all_drives(
         devices_directory: Path = Path("/dev"),
         only_symbolic_links: bool = False,
-        blacklist: list[str] = [],
+        blacklist: Iterable[str] | None = None,
     ) -> list[type["Disc"]]:
-        discs = []
-        for device in devices_directory.iterdir():
-            if not device.is_block_device():
-                continue
+        # Any iterable of names is accepted; It is only converted once.
+        blacklist = frozenset(blacklist or ())
 
-            if only_symbolic_links and not device.is_symlink():
-                continue
+        # The entry name and symlink checks come from the directory listing itself,
+        # so only the remaining entries are stat'd (once).
+        candidates = []
+        with os.scandir(devices_directory) as entries:
+            for entry in entries:
+                if entry.name in blacklist:
+                    continue
 
-            if device.name in blacklist:
-                continue
+                if only_symbolic_links and not entry.is_symlink():
+                    continue
+
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+
+                if not stat.S_ISBLK(st.st_mode):
+                    continue
+
+                if os.major(st.st_rdev) != Disc.MAJOR_DEV_SCSI_CDROM:
+                    continue
 
-            disc = Disc(device)
-            if disc.valid:
-                discs += [disc]
-        discs.sort()
+                candidates += [(Path(entry.path), st.st_rdev)]
+
+        # Each query blocks on the drive (especially when it is not ready),
+        # so the devices are queried concurrently rather than one at a time.
+        discs = []
+        if candidates:
+            with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+                for disc in executor.map(lambda c: Disc(*c), candidates):
+                    if disc.valid:
+                        discs += [disc]
+        discs.sort(key=attrgetter("_sort_key"))
         return discs
 
 
+class _DiscFd:
+    """Tray commands for an already open device; See Disc.session()"""
+
+    def __init__(self, fd: int):
+        self.fd: int = fd
+
+    def eject(self) -> int:
+        return _ioctl(self.fd, Disc.CDROM_EJECT)
+
+    def close(self) -> int:
+        return _ioctl(self.fd, Disc.CDROM_CLOSETRAY)
+
+    def unlock(self) -> int:
+        return _ioctl(self.fd, Disc.CDROM_LOCKDOOR, 0)
+
+    def lock(self) -> int:
+        return _ioctl(self.fd, Disc.CDROM_LOCKDOOR, 1)
+
+
 if __name__ == "__main__":
     epilog = "If no arguments are given, each drive status is printed."
     parser = argparse.ArgumentParser(epilog=epilog)
@@ -247,14 +394,18 @@ if __name__ == "__main__":
         help="Scan given directory when looking for devices to query if no devices are given as args",
     )
     parser.add_argument(
-        "disc_devices", type=Disc, metavar="device", action="store", nargs="*"
+        "disc_devices",
+        type=lambda p: Disc(Path(p), lazy=True),
+        metavar="device",
+        action="store",
+        nargs="*",
     )
     parser.add_argument(
         "--blacklist",
         action="append",
-        type=list[str],
-        default=["cdrom", "dvd"],
-        help="Add device names to ignore blacklist",
+        type=str,
+        default=None,
+        help="Add device names to ignore blacklist (in addition to cdrom and dvd)",
     )
     parser.add_argument(
         "--all",
@@ -265,7 +416,7 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     disc_devices = args.disc_devices
-    blacklist = args.blacklist
+    blacklist = frozenset(["cdrom", "dvd", *(args.blacklist or [])])
     query = args.query
     unlock = args.unlock
     lock = args.lock
@@ -275,7 +426,7 @@ if __name__ == "__main__":
     only_symbolic_links = not args.all
 
     if not only_symbolic_links:
-        blacklist = []
+        blacklist = frozenset()
 
     if not query.exists():
         print("The given device query path could not be found!")
@@ -288,19 +439,22 @@ if __name__ == "__main__":
 
     for d in disc_devices:
         if d.valid:
-            if unlock:
-                print("Unlocking {}".format(d.name()))
-                d.unlock_tray()
-            elif lock:
-                print("Locking {}".format(d.name()))
-                d.lock_tray()
-            if eject:
-                print("Ejecting {}".format(d.name()))
-                d.eject_tray()
-            elif close:
-                print("Closing {}".format(d.name()))
-                d.close_tray()
             if not (unlock or lock or eject or close):
                 print("{}\n".format(d))
+                continue
+
+            with d.session() as s:
+                if unlock:
+                    print("Unlocking {}".format(d.name()))
+                    s.unlock()
+                elif lock:
+                    print("Locking {}".format(d.name()))
+                    s.lock()
+                if eject:
+                    print("Ejecting {}".format(d.name()))
+                    s.eject()
+                elif close:
+                    print("Closing {}".format(d.name()))
+                    s.close()
         else:
             print("Bad Device: {}\n".format(d.name()))
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+import csv
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import ClassVar
@@ -185,27 +187,68 @@ class MakeMKVMessage:
         Comment: int = 49
         OffsetSequenceId: int = 50
 
-    MSG_CODE_ERRORS: ClassVar[set[int]] = (
-        MSG_CODE.LIBMKV_TRACE,
-        MSG_CODE.UDF_NODE_FAILED,
-        MSG_CODE.SCSI_ERROR,
-        MSG_CODE.HASH_CHECK_ERROR,
-        MSG_CODE.CORRUPT_SOURCE_FILE,
-        MSG_CODE.TOO_MANY_AV_SYNC_ISSUES,
-        MSG_CODE.TITLE_SAVE_FAIL,
-        MSG_CODE.TITLES_SAVE_FAIL,
-        MSG_CODE.DISC_OPEN_FAIL,
-        MSG_CODE.COPY_COMPLETE_TITLES_FAILED,
-        MSG_CODE.EVALUATION_PERIOD_EXPIRED_FREE_FUNC_ONLY,
-        MSG_CODE.EVALUATION_PERIOD_EXPIRED_NO_SHARE_FUNC,
-        MSG_CODE.HASH_CHECK_FAILURE,
-        MSG_CODE.TOO_MANY_HASH_CHECK_FAILURES,
+    MSG_CODE_ERRORS: ClassVar[frozenset[int]] = frozenset(
+        {
+            MSG_CODE.LIBMKV_TRACE,
+            MSG_CODE.UDF_NODE_FAILED,
+            MSG_CODE.SCSI_ERROR,
+            MSG_CODE.HASH_CHECK_ERROR,
+            MSG_CODE.CORRUPT_SOURCE_FILE,
+            MSG_CODE.TOO_MANY_AV_SYNC_ISSUES,
+            MSG_CODE.TITLE_SAVE_FAIL,
+            MSG_CODE.TITLES_SAVE_FAIL,
+            MSG_CODE.DISC_OPEN_FAIL,
+            MSG_CODE.COPY_COMPLETE_TITLES_FAILED,
+            MSG_CODE.EVALUATION_PERIOD_EXPIRED_FREE_FUNC_ONLY,
+            MSG_CODE.EVALUATION_PERIOD_EXPIRED_NO_SHARE_FUNC,
+            MSG_CODE.HASH_CHECK_FAILURE,
+            MSG_CODE.TOO_MANY_HASH_CHECK_FAILURES,
+        }
+    )
+
+    MSG_CODE_SUCCESS: ClassVar[frozenset[int]] = frozenset(
+        {MSG_CODE.OPERATION_COMPLETE}
     )
 
-    MSG_CODE_SUCCESS: ClassVar[set[int]] = (MSG_CODE.OPERATION_COMPLETE,)
+
+# The attr ids with values that are converted to an int by MakeMKVParser._process_id
+_INT_ATTR_IDS: frozenset[int] = frozenset(
+    {
+        MakeMKVMessage.ATTR_ID.OrderWeight,
+        MakeMKVMessage.ATTR_ID.ChapterCount,
+        MakeMKVMessage.ATTR_ID.DiskSizeBytes,
+        MakeMKVMessage.ATTR_ID.SegmentsCount,
+        MakeMKVMessage.ATTR_ID.StreamFlags,
+        MakeMKVMessage.ATTR_ID.AudioChannelsCount,
+        MakeMKVMessage.ATTR_ID.AudioSampleRate,
+        MakeMKVMessage.ATTR_ID.AudioSampleSize,
+    }
+)
 
 
 class MakeMKVParser:
+    # Value to member lookups, avoiding an enum construction for every message
+    # ATTR_ID names indexed by value; These are used as the disc, title and stream keys.
+    _ATTR_ID_KEYS: ClassVar[list[str]] = [
+        member.name for member in sorted(MakeMKVMessage.ATTR_ID)
+    ]
+    _MSG_CODE_MAP: ClassVar[dict[int, MakeMKVMessage.MSG_CODE]] = (
+        MakeMKVMessage.MSG_CODE._value2member_map_
+    )
+
+    # Known values used to validate MSG and DRV messages
+    _UI_MSG_VALUES: ClassVar[frozenset[int]] = frozenset(MakeMKVMessage.UI_MSG)
+    _DRIVE_STATE_VALUES: ClassVar[frozenset[int]] = frozenset(
+        MakeMKVMessage.DRIVE_STATE
+    )
+    _DISC_FLAG_VALUES: ClassVar[frozenset[int]] = frozenset(MakeMKVMessage.DISC_FLAG)
+
+    # These message types never contain quoted fields, so a plain split is enough.
+    # PRGV in particular makes up most of the output during a rip.
+    _PLAIN_TYPES: ClassVar[frozenset[str]] = frozenset(
+        {MakeMKVMessage.PRGV, MakeMKVMessage.TCOUNT}
+    )
+
     def __init__(self) -> None:
         # This is the last raw message received from parse().
         self.raw_message: str = ""
@@ -250,7 +293,8 @@ class MakeMKVParser:
         # Each title dict also contains also contains a "streams"  key, with a dict for each stream.
         # Each stream dict's keys and values are the MakeMKVMessage.ATTR_ID names and values.
         # I.e.
-        # For "Duration" of title #0: self.titles[0][MakeMKVMessage.ATTR_ID.Duration]
+        # For "Duration" of title #0: self.titles[0]["Duration"]
+        # (or self.titles[0][MakeMKVMessage.ATTR_ID.Duration.name])
         # For stream #2 of title #0: self.titles[0]["streams"][2]
         self.titles: dict[int, dict] = {}
 
@@ -264,35 +308,38 @@ class MakeMKVParser:
         # It is not reset.
         self.message_success_count: int = 0
 
+        # Each message type is handled by its own method
+        self._dispatch: dict[str, Callable[[list[str]], None]] = {
+            MakeMKVMessage.PRGV: self._parse_prgv,
+            MakeMKVMessage.DRV: self._parse_drv,
+            MakeMKVMessage.MSG: self._parse_msg,
+            MakeMKVMessage.PRGC: self._parse_prgc_prgt,
+            MakeMKVMessage.PRGT: self._parse_prgc_prgt,
+            MakeMKVMessage.CINFO: self._parse_cinfo,
+            MakeMKVMessage.TINFO: self._parse_tinfo,
+            MakeMKVMessage.SINFO: self._parse_sinfo,
+            MakeMKVMessage.TCOUNT: self._parse_tcount,
+        }
+
     def _process_id(self, id: int, raw_value: str) -> int | str:
         """Process the attr id and value from MakeMKV {C,T,S}INFO messages
 
-        This removes the double quotes from any "value" strings.
+        The double quotes are already removed from any "value" strings by parse().
         The value will be converted to an int or other type when it makes sense.
 
         There is a special case for "Duration", where it will be returned as an integer in seconds.
 
         """
-        raw_value = raw_value.replace('"', "")
-        match id:
-            case MakeMKVMessage.ATTR_ID.Duration:
-                hours, minutes, seconds = map(int, raw_value.split(":", 2))
-                seconds += hours * 3600
-                seconds += minutes * 60
-                return seconds
-            case (
-                MakeMKVMessage.ATTR_ID.OrderWeight
-                | MakeMKVMessage.ATTR_ID.ChapterCount
-                | MakeMKVMessage.ATTR_ID.DiskSizeBytes
-                | MakeMKVMessage.ATTR_ID.SegmentsCount
-                | MakeMKVMessage.ATTR_ID.StreamFlags
-                | MakeMKVMessage.ATTR_ID.AudioChannelsCount
-                | MakeMKVMessage.ATTR_ID.AudioSampleRate
-                | MakeMKVMessage.ATTR_ID.AudioSampleSize
-            ):
-                return int(raw_value)
-            case _:
-                return raw_value
+        if id == MakeMKVMessage.ATTR_ID.Duration:
+            # H:MM:SS or HH:MM:SS
+            return (
+                int(raw_value[:-6]) * 3600
+                + int(raw_value[-5:-3]) * 60
+                + int(raw_value[-2:])
+            )
+        if id in _INT_ATTR_IDS:
+            return int(raw_value)
+        return raw_value
 
     def parse(self, message: str) -> None:
         """
@@ -307,153 +354,13 @@ class MakeMKVParser:
 
         try:
             self.message_type, content = self.raw_message.split(":", 1)
-            match self.message_type:
-                # Progress message for current operation and total progress
-                case MakeMKVMessage.PRGV:
-                    current, total, maximum_progress = map(float, content.split(",", 2))
-                    self.progress = current / maximum_progress
-                    self.total_progress = total / maximum_progress
-
-                # Individual disc drive message
-                case MakeMKVMessage.DRV:
-                    index, visible, enabled, flags, drive_name, disc_name = (
-                        content.split(",", 5)
-                    )
-                    self.drive_index = int(index)
-                    self.drive_visible = int(visible)
-                    self.disc_flags = int(flags)
-                    self.drive_enabled = int(enabled)
-                    self.drive_name = drive_name
-                    self.disc_name = disc_name
-
-                    try:
-                        MakeMKVMessage.DRIVE_STATE(self.drive_visible)
-                    except ValueError:
-                        raise ValueError(
-                            "The DRV visible value {} was not found!".format(
-                                self.drive_visible
-                            )
-                        )
-
-                    try:
-                        MakeMKVMessage.DISC_FLAG(self.disc_flags)
-                    except ValueError:
-                        raise ValueError(
-                            "The DRV flags value {} was not found!".format(
-                                self.disc_flags
-                            )
-                        )
-
-                # Literally "a message"; Content varies by message.
-                case MakeMKVMessage.MSG:
-                    code, flags, count, message, content = content.split(",", 4)
-
-                    self.message_code = int(code)
-                    self.message_flags = int(flags)
-                    count = int(count)
-
-                    if message:
-                        self.message = message.replace('"', "")
-
-                    try:
-                        self.message_format, params = content.split(",", 1)
-                    except ValueError:
-                        self.message_format = content
-
-                    if count:
-                        self.message_params = params.split(",", count - 1)
-                    else:
-                        self.message_params = []
-
-                    try:
-                        MakeMKVMessage.UI_MSG(self.message_flags)
-                    except ValueError:
-                        raise ValueError(
-                            "The MSG flags value {} was not found!".format(flags)
-                        )
-
-                    try:
-                        MakeMKVMessage.MSG_CODE(self.message_code)
-                    except ValueError:
-                        raise ValueError(
-                            "The MSG code value {} was not found!".format(code)
-                        )
-
-                    if code in list(MakeMKVMessage.MSG_CODE_ERRORS):
-                        self.message_error_count += 1
-
-                    if code in list(MakeMKVMessage.MSG_CODE_SUCCESS):
-                        self.message_success_count += 1
-                        # Reset erorr count when operation is successful.
-                        self.message_error_count = 0
-
-                # Current / Total Progress Title
-                case MakeMKVMessage.PRGC | MakeMKVMessage.PRGT:
-                    code, id, name = content.split(",", 2)
-                    self.message_code = int(code)
-                    self.title_number = int(id)
-                    self.message = name.replace('"', "")
-                    self.operation = MakeMKVMessage.MSG_CODE(self.message_code)
-
-                    # Reset MSG items
-                    self.message_flags = -1
-                    self.message_format = ""
-                    self.message_params = []
-
-                # Disc Information
-                case MakeMKVMessage.CINFO:
-                    id, code, value = content.split(",", 2)
-                    id = int(id)
-                    code = int(code)
-                    value = self._process_id(id, value)
-                    self.disc[MakeMKVMessage.ATTR_ID(id)] = value
-
-                # Title Information
-                case MakeMKVMessage.TINFO:
-                    title_number, id, code, value = content.split(",", 3)
-                    title_number = int(title_number)
-                    id = int(id)
-                    code = int(code)
-                    value = self._process_id(id, value)
-
-                    # Add new title
-                    if title_number not in self.titles:
-                        self.titles[title_number] = {}
-                        self.titles[title_number]["streams"] = {}
-
-                    # Populate title information
-                    self.titles[title_number][MakeMKVMessage.ATTR_ID(id)] = value
-
-                # Stream Information
-                case MakeMKVMessage.SINFO:
-                    title_number, stream_number, id, code, value = content.split(",", 4)
-                    title_number = int(title_number)
-                    stream_number = int(stream_number)
-                    id = int(id)
-                    code = int(code)
-                    value = self._process_id(id, value)
-
-                    # Add new title; This is not expected to ever be needed unless messages are out of order.
-                    if title_number not in self.titles:
-                        self.titles[title_number] = {}
-                        self.titles[title_number]["streams"] = {}
-
-                    # Add new stream
-                    if stream_number not in self.titles[title_number]["streams"]:
-                        self.titles[title_number]["streams"][stream_number] = {}
-
-                    # Populate stream information
-                    self.titles[title_number]["streams"][stream_number][
-                        MakeMKVMessage.ATTR_ID(id)
-                    ] = value
-
-                # Title Count
-                case MakeMKVMessage.TCOUNT:
-                    self.title_count = int(content)
-
-                # This should not be reached unless a new message type is added.
-                case _:
-                    self.message = "Unknown MakeMKV Type! - {}".format(self.raw_message)
+            handler = self._dispatch.get(self.message_type, self._parse_unknown)
+            if self.message_type in MakeMKVParser._PLAIN_TYPES:
+                fields = content.split(",")
+            else:
+                # Fields are split and unquoted in one pass; quoted values may contain commas.
+                fields = next(csv.reader([content]))
+            handler(fields)
 
         except Exception as e:
             exception_message = (
@@ -462,3 +369,124 @@ class MakeMKVParser:
                 )
             )
             self.message = exception_message
+
+    def _parse_prgv(self, fields: list[str]) -> None:
+        """Progress message for current operation and total progress"""
+        current, total, maximum_progress = map(float, fields)
+        self.progress = current / maximum_progress
+        self.total_progress = total / maximum_progress
+
+    def _parse_drv(self, fields: list[str]) -> None:
+        """Individual disc drive message"""
+        index, visible, enabled, flags, drive_name, disc_name = fields[:6]
+        self.drive_index = int(index)
+        self.drive_visible = int(visible)
+        self.disc_flags = int(flags)
+        self.drive_enabled = int(enabled)
+        self.drive_name = drive_name
+        self.disc_name = disc_name
+
+        if self.drive_visible not in MakeMKVParser._DRIVE_STATE_VALUES:
+            raise ValueError(
+                "The DRV visible value {} was not found!".format(self.drive_visible)
+            )
+
+        if self.disc_flags not in MakeMKVParser._DISC_FLAG_VALUES:
+            raise ValueError(
+                "The DRV flags value {} was not found!".format(self.disc_flags)
+            )
+
+    def _parse_msg(self, fields: list[str]) -> None:
+        """Literally "a message"; Content varies by message."""
+        code, flags, count, message, self.message_format = fields[:5]
+
+        self.message_code = int(code)
+        self.message_flags = int(flags)
+        count = int(count)
+
+        if message:
+            self.message = message
+
+        self.message_params = fields[5 : 5 + count]
+
+        if self.message_flags not in MakeMKVParser._UI_MSG_VALUES:
+            raise ValueError("The MSG flags value {} was not found!".format(flags))
+
+        if self.message_code not in MakeMKVParser._MSG_CODE_MAP:
+            raise ValueError("The MSG code value {} was not found!".format(code))
+
+        if self.message_code in MakeMKVMessage.MSG_CODE_ERRORS:
+            self.message_error_count += 1
+
+        if self.message_code in MakeMKVMessage.MSG_CODE_SUCCESS:
+            self.message_success_count += 1
+            # Reset erorr count when operation is successful.
+            self.message_error_count = 0
+
+    def _parse_prgc_prgt(self, fields: list[str]) -> None:
+        """Current / Total Progress Title"""
+        code, id, name = fields
+        self.message_code = int(code)
+        self.title_number = int(id)
+        self.message = name
+        self.operation = MakeMKVParser._MSG_CODE_MAP[self.message_code]
+
+        # Reset MSG items
+        self.message_flags = -1
+        self.message_format = ""
+        self.message_params = []
+
+    def _parse_cinfo(self, fields: list[str]) -> None:
+        """Disc Information"""
+        id, code, value = fields
+        id = int(id)
+        code = int(code)
+        value = self._process_id(id, value)
+        self.disc[MakeMKVParser._ATTR_ID_KEYS[id]] = value
+
+    def _parse_tinfo(self, fields: list[str]) -> None:
+        """Title Information"""
+        title_number, id, code, value = fields
+        title_number = int(title_number)
+        id = int(id)
+        code = int(code)
+        value = self._process_id(id, value)
+
+        # Add new title
+        if title_number not in self.titles:
+            self.titles[title_number] = {}
+            self.titles[title_number]["streams"] = {}
+
+        # Populate title information
+        self.titles[title_number][MakeMKVParser._ATTR_ID_KEYS[id]] = value
+
+    def _parse_sinfo(self, fields: list[str]) -> None:
+        """Stream Information"""
+        title_number, stream_number, id, code, value = fields
+        title_number = int(title_number)
+        stream_number = int(stream_number)
+        id = int(id)
+        code = int(code)
+        value = self._process_id(id, value)
+
+        # Add new title; This is not expected to ever be needed unless messages are out of order.
+        if title_number not in self.titles:
+            self.titles[title_number] = {}
+            self.titles[title_number]["streams"] = {}
+
+        # Add new stream
+        if stream_number not in self.titles[title_number]["streams"]:
+            self.titles[title_number]["streams"][stream_number] = {}
+
+        # Populate stream information
+        self.titles[title_number]["streams"][stream_number][
+            MakeMKVParser._ATTR_ID_KEYS[id]
+        ] = value
+
+    def _parse_tcount(self, fields: list[str]) -> None:
+        """Title Count"""
+        self.title_count = int(fields[0])
+
+    def _parse_unknown(self, fields: list[str]) -> None:
+        """This should not be reached unless a new message type is added."""
+        self.message = "Unknown MakeMKV Type! - {}".format(self.raw_message)
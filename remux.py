@@ -2,13 +2,24 @@
 
 import argparse
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 from common import get_logger
-from container import Container, StreamData
+from container import Container
+from ripper import IO_JOBS, Ripper, init_worker
 
 # This is a shim for remuxing files that have been processed previously without remuxing.
 
+
+def _remux_one(filename: Path, remux_profile: str) -> None:
+    """Remux a single file according to one of the Ripper remux profiles"""
+    c = Container(filename)
+    c.remux_and_set_defaults(**Ripper.REMUX_PROFILES[remux_profile])
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("-f", "--filename", type=Path, help="An MKV to process")
@@ -39,6 +50,13 @@ if __name__ == "__main__":
         action="store_true",
         help="Remux videos to include only English and Japanese audio and subtitles. English audio will be preferred while subtitles will not be enabled by default.",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=IO_JOBS,
+        help="The number of files to remux at the same time. Defaults to RIPPER_IO_JOBS (or 2).",
+    )
     parser.add_argument("--debug", action="store_true", help="Turn on debug messages.")
 
     logger = get_logger("RIP")
@@ -56,50 +74,30 @@ if __name__ == "__main__":
             files += [args.filename]
 
     if args.directory:
-        for _file in args.directory.rglob("*.mkv", case_sensitive=False):
-            if _file.is_file():
-                files += [_file]
+        # The directory listing already says which entries are files, so nothing else is stat'd
+        for dirpath, _, filenames in os.walk(args.directory):
+            for filename in filenames:
+                if filename.lower().endswith(".mkv"):
+                    files += [Path(dirpath, filename)]
+
+    # Set remux profile
+    remux_profile = Ripper.REMUX_NONE
+    if args.remux_english:
+        remux_profile = Ripper.REMUX_ENGLISH_ONLY
+    elif args.remux_japanese:
+        remux_profile = Ripper.REMUX_JAPANESE_ONLY
+    elif args.remux_subs:
+        remux_profile = Ripper.REMUX_ANIME_SUBS
+    elif args.remux_dubs:
+        remux_profile = Ripper.REMUX_ANIME_DUBS
 
-    for _file in files:
-        c = Container(_file)
-        if args.remux_english:
-            c.remux_by_language(
-                audio_languages=[StreamData.LANG_ENG],
-                subtitle_languages=[StreamData.LANG_ENG],
-            )
-            c.clear_default_audio()
-            c.set_preferred_audio_by_language(
-                StreamData.LANG_ENG, default_required=True
-            )
-            c.clear_default_subtitles()
-        elif args.remux_japanese:
-            c.remux_by_language(
-                audio_languages=[StreamData.LANG_JPN],
-                subtitle_languages=[StreamData.LANG_JPN],
-            )
-            c.clear_default_audio()
-            c.set_preferred_audio_by_language(
-                StreamData.LANG_JPN, default_required=True
-            )
-            c.clear_default_subtitles()
-        elif args.remux_dubs:
-            c.remux_by_language(
-                audio_languages=[StreamData.LANG_ENG, StreamData.LANG_JPN],
-                subtitle_languages=[StreamData.LANG_ENG, StreamData.LANG_JPN],
-            )
-            c.clear_default_audio()
-            c.set_preferred_audio_by_language(
-                StreamData.LANG_ENG, default_required=True
-            )
-            c.clear_default_subtitles()
-        elif args.remux_subs:
-            c.remux_by_language(
-                audio_languages=[StreamData.LANG_ENG, StreamData.LANG_JPN],
-                subtitle_languages=[StreamData.LANG_ENG, StreamData.LANG_JPN],
-            )
-            c.clear_default_audio()
-            c.set_preferred_audio_by_language(
-                StreamData.LANG_JPN, default_required=True
-            )
-            c.clear_default_subtitles()
-            c.set_preferred_subtitles_by_language(StreamData.LANG_ENG)
+    if remux_profile == Ripper.REMUX_NONE:
+        logger.debug("No remuxing was requested. Skipping remuxing.")
+    elif files:
+        # Each file is remuxed independently in its own process
+        with ProcessPoolExecutor(
+            max_workers=max(1, min(args.jobs, len(files))),
+            initializer=init_worker,
+            initargs=(logger.level,),
+        ) as ex:
+            list(ex.map(_remux_one, files, repeat(remux_profile)))
@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 
 import argparse
+import copy
 import logging
+import multiprocessing
+import os
+import queue
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractContextManager
 from pathlib import Path
 from typing import ClassVar
 
@@ -13,6 +19,23 @@ from container import Container, StreamData
 from disc import Disc
 from makemkv import MakeMKVMessage, MakeMKVParser
 
+# This is the number of remuxes allowed to run at the same time.
+# It can be set with the RIPPER_IO_JOBS environment variable.
+IO_JOBS: int = max(1, int(os.environ.get("RIPPER_IO_JOBS", "2")))
+
+# This limits remuxes within a process; main() replaces it with one shared by all rippers.
+_io_semaphore: AbstractContextManager = threading.BoundedSemaphore(IO_JOBS)
+
+# These are the bounds for a given year.
+# 1888 is year for oldest surviving film, the "Roundhay Garden Scene"
+_MIN_YEAR: int = 1888
+_MAX_YEAR: int = int(time.strftime("%Y"))
+
+# This holds titles found by makemkvcon info, keyed by (volume id, minimum duration).
+# A disc scanned again reuses its titles instead of being scanned again.
+# main() replaces it with one shared by all rippers.
+_INFO_CACHE: MutableMapping[tuple[str, int], dict] = {}
+
 
 class Ripper:
     """This class acts as a frontend to other commands for media extraction and basic post-processing."""
@@ -20,6 +43,9 @@ class Ripper:
     VIDEO_GENERIC: ClassVar[str] = "VIDEO"
     VIDEO_MOVIE: ClassVar[str] = "MOVIE"
     VIDEO_SHOW: ClassVar[str] = "SHOW"
+    _VIDEO_TYPES: ClassVar[frozenset[str]] = frozenset(
+        {VIDEO_GENERIC, VIDEO_MOVIE, VIDEO_SHOW}
+    )
 
     REMUX_NONE: ClassVar[str] = "REMUX_NONE"
     REMUX_ENGLISH_ONLY: ClassVar[str] = "REMUX_ENGLISH_ONLY"
@@ -27,6 +53,37 @@ class Ripper:
     REMUX_ANIME_SUBS: ClassVar[str] = "REMUX_ANIME_SUBS"
     REMUX_ANIME_DUBS: ClassVar[str] = "REMUX_ANIME_DUBS"
 
+    # These are the Container.remux_and_set_defaults arguments for each remux profile
+    REMUX_PROFILES: ClassVar[dict[str, dict]] = {
+        REMUX_ENGLISH_ONLY: {
+            "audio_languages": [StreamData.LANG_ENG],
+            "subtitle_languages": [StreamData.LANG_ENG],
+            "default_audio_language": StreamData.LANG_ENG,
+            "default_subtitle_language": "",
+        },
+        REMUX_JAPANESE_ONLY: {
+            "audio_languages": [StreamData.LANG_JPN],
+            "subtitle_languages": [StreamData.LANG_JPN],
+            "default_audio_language": StreamData.LANG_JPN,
+            "default_subtitle_language": "",
+        },
+        REMUX_ANIME_DUBS: {
+            "audio_languages": [StreamData.LANG_ENG, StreamData.LANG_JPN],
+            "subtitle_languages": [StreamData.LANG_ENG, StreamData.LANG_JPN],
+            "default_audio_language": StreamData.LANG_ENG,
+            "default_subtitle_language": "",
+        },
+        REMUX_ANIME_SUBS: {
+            "audio_languages": [StreamData.LANG_ENG, StreamData.LANG_JPN],
+            "subtitle_languages": [StreamData.LANG_ENG, StreamData.LANG_JPN],
+            "default_audio_language": StreamData.LANG_JPN,
+            "default_subtitle_language": StreamData.LANG_ENG,
+        },
+    }
+
+    # makemkvcon --robot output is verbose, so its stdout pipe is enlarged to keep it from blocking on writes
+    PIPE_SIZE: ClassVar[int] = 1 << 20
+
     ID: ClassVar[int] = 0
 
     def __init__(
@@ -45,27 +102,18 @@ class Ripper:
         Ripper.ID += 1
         self.id = Ripper.ID
 
-        if not title:
-            raise ValueError("The media title has not been set!")
-
-        if not root_directory.exists():
-            raise FileNotFoundError("The root directory was not found!")
-
-        if type(season) is int:
-            if season < 0:
-                raise ValueError("The season is less than zero!")
-
-        if media_type not in [
-            Ripper.VIDEO_GENERIC,
-            Ripper.VIDEO_MOVIE,
-            Ripper.VIDEO_SHOW,
-        ]:
-            raise ValueError("The media type was not recognized!")
-
-        if minimum_duration >= maximum_duration:
-            raise ValueError("Maximum duration must be greater than minimum!")
+        Ripper._validate_args(
+            root_directory,
+            minimum_duration,
+            maximum_duration,
+            media_type,
+            title,
+            season,
+            year,
+        )
 
         self.logger: logging.Logger = get_logger("RIP")
+        self._makemkvcon: str = check_command("makemkvcon").as_posix()
         self.raw_filename: Path = filename.absolute()
         self.disc: Disc = Disc(self.raw_filename)
 
@@ -90,6 +138,14 @@ class Ripper:
         self.minimum_duration: int = minimum_duration
         self.maximum_duration: int = maximum_duration
 
+        # Every makemkvcon command starts with these arguments.
+        self._mkv_cmd_prefix: tuple[str, ...] = (
+            self._makemkvcon,
+            f"--minlength={self.minimum_duration}",
+            "--robot",
+            "--noscan",
+        )
+
         # This is set after the run_command calls. It should be the last external command exit code.
         self.last_run_code: int = -1
 
@@ -97,7 +153,9 @@ class Ripper:
         self.eject_on_rip: bool = eject
 
         # This will control how videos are remuxed (including not remuxing).
+        # The profile's arguments are None for REMUX_NONE.
         self.remux_profile = remux_profile
+        self._remux_kwargs: dict | None = Ripper.REMUX_PROFILES.get(remux_profile)
 
         # This must be one of VIDEO_GENERIC, VIDEO_MOVIE, VIDEO_SHOW
         self.media_type: str = media_type
@@ -118,24 +176,64 @@ class Ripper:
             "{}".format(media_name)
         )
 
+        # These filename fragments are the same for every title on the disc.
+        # The season fragment is None unless the season is usable in a filename.
+        self._media_title: str = media_name
+        self._id_str: str = f"{self.id:02d}"
+        self._season_str: str | None = None
+        if type(self.season) is int and self.season >= 0:
+            self._season_str = f"{self.season:02d}"
+
         # Setup videos directory but don't create the directory.
         # This may be named similarly to "ripper1". It's wherever the MKV files are written to initially.
         # Note that there are potential naming conflicts with this directory and contained files
         self.videos_directory = self.media_directory.joinpath(self.raw_filename.stem)
 
+    @staticmethod
+    def _validate_args(
+        root_directory: Path,
+        minimum_duration: int,
+        maximum_duration: int,
+        media_type: str,
+        title: str,
+        season: int | None,
+        year: int | None,
+    ) -> None:
+        """Check the arguments given to a Ripper, raising an error for the first invalid one."""
+        if not title:
+            raise ValueError("The media title has not been set!")
+
+        if not root_directory.exists():
+            raise FileNotFoundError("The root directory was not found!")
+
+        # 0 is a common value for a season representing any "specials", so it is valid
+        if type(season) is int and season < 0:
+            raise ValueError("The season is less than zero!")
+
+        if year and not _MIN_YEAR <= year <= _MAX_YEAR:
+            raise ValueError(
+                "The given year was not within {}-{}!".format(_MIN_YEAR, _MAX_YEAR)
+            )
+
+        if media_type not in Ripper._VIDEO_TYPES:
+            raise ValueError("The media type was not recognized!")
+
+        if minimum_duration >= maximum_duration:
+            raise ValueError("Maximum duration must be greater than minimum!")
+
     def _process_video_remux(
         self,
         filename: Path,
         audio_languages: list[str],
         subtitle_languages: list[str],
-        preferred_audio_language: str,
-        preferred_subtitle_language: str,
+        default_audio_language: str,
+        default_subtitle_language: str,
     ):
         """Remux video to remove unwanted streams.
 
         The audio and subtitle languages streams will be kept.
         All other streams will be removed.
-        Any prefered languages will set a corresponding stream as default, if available.
+        Any default languages will set a corresponding stream as default, if available.
         """
         c = Container(filename)
         self.logger.debug(
@@ -146,58 +244,28 @@ class Ripper:
         self.logger.debug(
             "Filtering subtitle streams to {}".format(" ".join(subtitle_languages))
         )
-        c.remux_by_language(audio_languages, subtitle_languages)
-
-        self.logger.debug(
-            "Setting default audio to {}".format(preferred_audio_language)
-        )
-        c.set_preferred_audio_by_language(preferred_audio_language)
-
-        if preferred_subtitle_language:
+        self.logger.debug("Setting default audio to {}".format(default_audio_language))
+        if default_subtitle_language:
             self.logger.debug(
-                "Setting default subtitles to {}".format(preferred_subtitle_language)
+                "Setting default subtitles to {}".format(default_subtitle_language)
+            )
+
+        # Remux and set the default streams with a single mkvmerge call
+        # Remuxing rewrites the whole file, so only a limited number may run at once
+        with _io_semaphore:
+            c.remux_and_set_defaults(
+                audio_languages,
+                subtitle_languages,
+                default_audio_language,
+                default_subtitle_language,
             )
-            c.set_preferred_subtitles_by_language(preferred_subtitle_language)
-        else:
-            c.clear_default_subtitles()
 
     def _process_video_remux_profile(self, filename: Path):
         """This function calls _process_video_remux based upon the instance's remux_profile."""
-        match self.remux_profile:
-            case Ripper.REMUX_ENGLISH_ONLY:
-                self._process_video_remux(
-                    filename=filename,
-                    audio_languages=[StreamData.LANG_ENG],
-                    subtitle_languages=[StreamData.LANG_ENG],
-                    preferred_audio_language=StreamData.LANG_ENG,
-                    preferred_subtitle_language="",
-                )
-            case Ripper.REMUX_JAPANESE_ONLY:
-                self._process_video_remux(
-                    filename=filename,
-                    audio_languages=[StreamData.LANG_JPN],
-                    subtitle_languages=[StreamData.LANG_JPN],
-                    preferred_audio_language=StreamData.LANG_JPN,
-                    preferred_subtitle_language="",
-                )
-            case Ripper.REMUX_ANIME_DUBS:
-                self._process_video_remux(
-                    filename=filename,
-                    audio_languages=[StreamData.LANG_ENG, StreamData.LANG_JPN],
-                    subtitle_languages=[StreamData.LANG_ENG, StreamData.LANG_JPN],
-                    preferred_audio_language=StreamData.LANG_ENG,
-                    preferred_subtitle_language="",
-                )
-            case Ripper.REMUX_ANIME_SUBS:
-                self._process_video_remux(
-                    filename=filename,
-                    audio_languages=[StreamData.LANG_ENG, StreamData.LANG_JPN],
-                    subtitle_languages=[StreamData.LANG_ENG, StreamData.LANG_JPN],
-                    preferred_audio_language=StreamData.LANG_JPN,
-                    preferred_subtitle_language=StreamData.LANG_ENG,
-                )
-            case Ripper.REMUX_NONE:
-                self.logger.debug("No remuxing was requested. Skipping remuxing.")
+        if self._remux_kwargs is None:
+            self.logger.debug("No remuxing was requested. Skipping remuxing.")
+            return
+        self._process_video_remux(filename=filename, **self._remux_kwargs)
 
     def _process_video_rename(self, filename: Path, title_number: int) -> Path:
         """Process video after extracting from disc.
@@ -206,43 +274,23 @@ class Ripper:
         """
 
         # Set new filename
-        media_title = self.title
-        if self.year:
-            media_title += " ({})".format(self.year)
-        name = "{} I{}T{}{}".format(
-            media_title,
-            str(self.id).zfill(2),
-            str(title_number).zfill(2),
-            filename.suffix,
+        name = (
+            f"{self._media_title} I{self._id_str}T{title_number:02d}{filename.suffix}"
         )
         new_filename = self.videos_directory.joinpath(name)
 
         # Reset new filename of show episode to use season and season directory
         # Create season directory if it does not exist
-        if self.media_type == Ripper.VIDEO_SHOW:
-            if type(self.season) is int:
-                if self.season >= 0:
-                    season_directory = self.media_directory.joinpath(
-                        "Season {}".format(str(self.season).zfill(2))
-                    )
-                    season_directory.mkdir(exist_ok=True)
-                    name = "{} I{}S{}T{}{}".format(
-                        media_title,
-                        str(self.id).zfill(2),
-                        str(self.season).zfill(2),
-                        str(title_number).zfill(2),
-                        filename.suffix,
-                    )
-                    new_filename = season_directory.joinpath(name)
+        if self.media_type == Ripper.VIDEO_SHOW and self._season_str is not None:
+            season_directory = self.media_directory.joinpath(
+                f"Season {self._season_str}"
+            )
+            season_directory.mkdir(exist_ok=True)
+            name = f"{self._media_title} I{self._id_str}S{self._season_str}T{title_number:02d}{filename.suffix}"
+            new_filename = season_directory.joinpath(name)
 
         # Reset new filename of movie to move media directory
         if self.media_type == Ripper.VIDEO_MOVIE:
-            name = "{} I{}T{}{}".format(
-                media_title,
-                str(self.id).zfill(2),
-                str(title_number).zfill(2),
-                filename.suffix,
-            )
             new_filename = self.media_directory.joinpath(name)
 
         # Rename file as long as new filename does not exist
@@ -252,20 +300,62 @@ class Ripper:
             self.logger.debug("Renamed {} to {}.".format(old_filename, filename))
         return filename
 
+    def _process_videos(self, videos: queue.Queue, failed: list[Path]) -> None:
+        """Rename and remux each (filename, title_number) from the queue until None is received.
+
+        Each filename that fails to process is appended to failed.
+        """
+        while (video := videos.get()) is not None:
+            filename, title_number = video
+            try:
+                # Process video to ensure it is named something more predictable
+                filename = self._process_video_rename(filename, title_number)
+
+                # Remux video to remove extraneous streams based on given profile
+                self._process_video_remux_profile(filename)
+            except Exception:
+                self.logger.exception("Processing {} failed!".format(filename))
+                failed += [filename]
+
     def _eject(self, time_limit: int = 60) -> bool:
         """Function that unlocks end ejects the disc.
 
         The function effectively ejects in a loop until the tray is open or the time limit is reached.
         Returns true if the disc tray is ultimately open, otherwise it returns false.
         """
-        timeout = time.time() + time_limit
-        while True:
+        deadline = time.monotonic() + time_limit
+        while time.monotonic() < deadline:
             self.disc.unlock_tray()
             self.disc.eject_tray()
             if self.disc.get_drive_status(self.disc.filename) == Disc.CDS_TRAY_OPEN:
                 return True
-            elif time.time() > timeout:
-                return False
+
+            # The tray takes seconds to move, so there is no need to retry any faster
+            time.sleep(0.5)
+        return False
+
+    def _run_makemkvcon(self, mmkv: MakeMKVParser, command: list[str]) -> int:
+        """Run a makemkvcon --robot command, parsing its output with the given parser.
+
+        New messages are logged as they change. The makemkvcon exit code is returned.
+        """
+        self.logger.debug("Raw command: {}".format(" ".join(command)))
+
+        # Messages are only tracked when they would actually be logged
+        debug_on = self.logger.isEnabledFor(logging.DEBUG)
+        last_message = ""
+        errors = []
+        mmkv_run = GeneratorExit(
+            run_command(command, errors, pipe_size=Ripper.PIPE_SIZE)
+        )
+        for line in mmkv_run:
+            mmkv.parse(line)
+            if debug_on and mmkv.message and mmkv.message != last_message:
+                self.logger.debug("%s", mmkv.message)
+                last_message = mmkv.message
+        for line in errors:
+            self.logger.error(line)
+        return mmkv_run.code
 
     def rip(self) -> None:
         """
@@ -294,26 +384,24 @@ class Ripper:
                 # This also holds title information found in mmkv.titles
                 mmkv = MakeMKVParser()
 
+                # The device is resolved once and shared by every makemkvcon command
+                dev_uri = "dev:{}".format(self.disc.filename.resolve())
+
                 # Setup makemkvcon for info
-                makemkvcon = check_command("makemkvcon")
-                command = [makemkvcon.as_posix()]
-                command += ["--minlength={}".format(self.minimum_duration)]
-                command += ["--robot"]
-                command += ["--noscan"]
-                command += ["info", "dev:{}".format(self.disc.filename.resolve())]
-                self.logger.debug("Raw command: {}".format(" ".join(command)))
-
-                # Run makemkvcon info to populate titles
-                last_message = ""
-
-                mmkv_info = GeneratorExit(run_command(command))
-                for line in mmkv_info:
-                    mmkv.parse(line)
-                    if mmkv.message:
-                        if mmkv.message != last_message:
-                            self.logger.debug(mmkv.message)
-                            last_message = mmkv.message
-                self.last_run_code = mmkv_info.code
+                command = [*self._mkv_cmd_prefix, "info", dev_uri]
+
+                # Run makemkvcon info to populate titles, unless this disc was scanned already
+                volume_id = self.disc.get_volume_id()
+                cache_key = (volume_id, self.minimum_duration)
+                cached_titles = _INFO_CACHE.get(cache_key) if volume_id else None
+                if cached_titles:
+                    self.logger.debug("Reusing titles found for volume %s.", volume_id)
+                    mmkv.titles = copy.deepcopy(cached_titles)
+                    self.last_run_code = 0
+                else:
+                    self.last_run_code = self._run_makemkvcon(mmkv, command)
+                    if volume_id and self.last_run_code == 0 and mmkv.titles:
+                        _INFO_CACHE[cache_key] = copy.deepcopy(mmkv.titles)
 
                 # Exit if no titles are left
                 if not mmkv.titles:
@@ -329,68 +417,94 @@ class Ripper:
                 Path.mkdir(self.videos_directory, exist_ok=True)
 
                 # Filter titles with a duration outside of the given range
-                max_duration = 0
-                for title_number in mmkv.titles:
-                    duration = mmkv.titles[title_number][
-                        MakeMKVMessage.ATTR_ID.Duration
-                    ]
-                    if duration < self.minimum_duration:
-                        mmkv.titles.pop(title_number)
-                    if duration > self.maximum_duration:
-                        mmkv.titles.pop(title_number)
-
-                    if duration >= max_duration:
-                        max_duration = duration
-
-                    # Filter any titles < (max_duration * movie_minimum) if feature_only set
-                    if self.media_type == Ripper.VIDEO_MOVIE and self.feature_only:
-                        if duration < (max_duration * self.movie_minimum):
-                            mmkv.titles.pop(title_number)
+                scanned_count = len(mmkv.titles)
+                duration_key = MakeMKVMessage.ATTR_ID.Duration.name
+                durations = {
+                    title_number: title[duration_key]
+                    for title_number, title in mmkv.titles.items()
+                    if self.minimum_duration
+                    <= title[duration_key]
+                    <= self.maximum_duration
+                }
+
+                # Filter any titles < (max_duration * movie_minimum) if feature_only set
+                min_allowed = 0
+                if durations and self.media_type == Ripper.VIDEO_MOVIE:
+                    if self.feature_only:
+                        min_allowed = self.movie_minimum * max(durations.values())
+
+                mmkv.titles = {
+                    title_number: mmkv.titles[title_number]
+                    for title_number, duration in durations.items()
+                    if duration >= min_allowed
+                }
 
                 # Set real title count to match what will be processed
                 self.title_count = len(mmkv.titles)
 
+                # Extracted videos are renamed and remuxed in a separate thread.
+                # This lets the next title be extracted while the previous one is processed.
+                videos = queue.Queue(maxsize=2)
+                failed_videos = []
+                post_processor = threading.Thread(
+                    target=self._process_videos,
+                    args=(videos, failed_videos),
+                    name="{}-post".format(self.raw_filename.stem),
+                    daemon=True,
+                )
+                post_processor.start()
+
+                # Titles are extracted in a single makemkvcon run when none were filtered out.
+                # Otherwise, each remaining title is extracted by itself.
+                if self.title_count > 1 and self.title_count == scanned_count:
+                    batches = [list(mmkv.titles)]
+                else:
+                    batches = [[title_number] for title_number in mmkv.titles]
+
                 # Iterate over titles found previously
-                for title_number in mmkv.titles:
-                    filename = self.videos_directory.joinpath(
-                        mmkv.titles[title_number][MakeMKVMessage.ATTR_ID.OutputFileName]
+                try:
+                    for batch in batches:
+                        filenames = {}
+                        for title_number in batch:
+                            filenames[title_number] = self.videos_directory.joinpath(
+                                mmkv.titles[title_number][
+                                    MakeMKVMessage.ATTR_ID.OutputFileName.name
+                                ]
+                            )
+
+                            # Delete the video file if it already exists
+                            filenames[title_number].unlink(missing_ok=True)
+
+                        selection = "all" if len(batch) > 1 else "{}".format(batch[0])
+
+                        # Setup makemkvcon for ripping
+                        command = [
+                            *self._mkv_cmd_prefix,
+                            "mkv",
+                            dev_uri,
+                            selection,
+                            str(self.videos_directory),
+                            "--messages=-stdout",
+                            "--progress=-same",
+                        ]
+
+                        # Run makemkvcon mkv
+                        self.last_run_code = self._run_makemkvcon(mmkv, command)
+
+                        # Hand the videos off for renaming and remuxing
+                        for title_number, filename in filenames.items():
+                            videos.put((filename, title_number))
+                finally:
+                    videos.put(None)
+                    post_processor.join()
+
+                # A video that failed to process means the rip did not work, so the disc is not ejected
+                if failed_videos:
+                    self.logger.error(
+                        "{} video(s) failed to process.".format(len(failed_videos))
                     )
-
-                    # Delete the video file if it already exists
-                    filename.unlink(missing_ok=True)
-
-                    # Setup makemkvcon for ripping
-                    makemkvcon = check_command("makemkvcon")
-                    command = [makemkvcon.as_posix()]
-                    command += ["--minlength={}".format(self.minimum_duration)]
-                    command += ["--robot"]
-                    command += ["--noscan"]
-                    command += [
-                        "mkv",
-                        "dev:{}".format(self.disc.filename.resolve()),
-                        "{}".format(title_number),
-                    ]
-                    command += ["{}".format(self.videos_directory)]
-                    command += ["--messages={}".format("-stdout")]
-                    command += ["--progress={}".format("-same")]
-                    self.logger.debug("Raw command: {}".format(" ".join(command)))
-
-                    # Run makemkvcon mkv
-                    last_message = ""
-                    mmkv_mkv = GeneratorExit(run_command(command))
-                    for line in mmkv_mkv:
-                        mmkv.parse(line)
-                        if mmkv.message:
-                            if mmkv.message != last_message:
-                                self.logger.debug(mmkv.message)
-                                last_message = mmkv.message
-                    self.last_run_code = mmkv_mkv
-
-                    # Process video to ensure it is named something more predictable
-                    filename = self._process_video_rename(filename, title_number)
-
-                    # Remux video to remove extraneous streams based on given profile
-                    filename = self._process_video_remux_profile(filename)
+                    if self.last_run_code == 0:
+                        self.last_run_code = 1
 
                 # The videos directory may be empty after renaming all files
                 # Delete the videos directory if it is empty
@@ -411,6 +525,21 @@ class Ripper:
         self.logger.debug("Rip Duration: {:.2f}s".format(time_elapsed))
 
 
+def init_worker(
+    level: int,
+    io_semaphore: AbstractContextManager | None = None,
+    info_cache: MutableMapping[tuple[str, int], dict] | None = None,
+) -> None:
+    """Set the logging level, the shared remux semaphore and the shared info cache in each worker process"""
+    global _io_semaphore, _INFO_CACHE
+
+    get_logger("RIP").setLevel(level)
+    if io_semaphore is not None:
+        _io_semaphore = io_semaphore
+    if info_cache is not None:
+        _INFO_CACHE = info_cache
+
+
 def process_disc_devices(
     devices: list[Path], devices_root: Path = Path("/dev")
 ) -> list[Path]:
@@ -431,24 +560,21 @@ def process_disc_devices(
         index += 1
 
     # Filter block devices and split out symlinks
-    devices = [x for x in devices if x.is_block_device()]
-    symlinks = [x for x in devices if x.is_symlink()]
-    direct_links = list(set([x for x in devices if not x.is_symlink()]))
-
-    # Filter symbolic links such that there is only 1 link for each target
-    # The symlinks are removed from the end of the list
-    symlinks.reverse()
-    for device in symlinks[:]:
-        if [x.resolve() for x in symlinks].count(device.resolve()) > 1:
-            symlinks.remove(device)
-    symlinks.reverse()
+    # Each device is resolved once; Only the first symbolic link given for each target is kept
+    symlinks = {}
+    direct_links = set()
+    for device in devices:
+        if not device.is_block_device():
+            continue
+        if device.is_symlink():
+            symlinks.setdefault(device.resolve(), device)
+        else:
+            direct_links.add(device)
 
     # Remove items that have both a direct link and symlink for the same target, keeping the symbolic link
-    for device in [x.resolve() for x in symlinks]:
-        if device in [x.resolve() for x in direct_links]:
-            direct_links.remove(device)
+    direct_links = [x for x in direct_links if x.resolve() not in symlinks]
 
-    devices = symlinks + direct_links
+    devices = list(symlinks.values()) + direct_links
     devices.sort()
     return devices
 
@@ -571,7 +697,6 @@ def main():
     # Process duration limits
     # Set minimum duration based on type if not specified
     # Otherwise, set minimum duration to 0 if not defined > 0
-    # Raise an error if maximum duration is not greater than minimum
     minimum_duration = args.minimum
     maximum_duration = args.maximum
     if media_type == Ripper.VIDEO_MOVIE and not minimum_duration:
@@ -580,30 +705,24 @@ def main():
         minimum_duration = 900
     elif not minimum_duration or minimum_duration < 0:
         minimum_duration = 0
-    if maximum_duration <= minimum_duration:
-        raise ValueError("Maximum duration must be greater than minimum!")
 
-    # Check year is within 1888 to current year
-    # 1888 is year for oldest surviving film, the "Roundhay Garden Scene"
     year = args.year
-    if year:
-        min_year = 1888
-        max_year = int(time.strftime("%Y"))
-        if year < min_year or year > max_year:
-            raise ValueError(
-                "The given year was not within {}-{}!".format(min_year, max_year)
-            )
-
-    # Check if season is valid
-    # 0 is a common value for a season representing any "specials", so it is valid
     season = args.season
-    if season:
-        if season < 0:
-            raise ValueError("The given season was less than 0!")
 
     # Determine output directory name based on title and year (if given)
     root_directory = args.output
 
+    # Check the arguments before any drives are processed
+    Ripper._validate_args(
+        root_directory,
+        minimum_duration,
+        maximum_duration,
+        media_type,
+        title,
+        season,
+        year,
+    )
+
     # Process given optical drives
     devices = args.devices
     devices = process_disc_devices(devices)
@@ -612,11 +731,25 @@ def main():
     eject = not args.no_eject
 
     # Rip media
+    # Each rip runs in its own process so parsing makemkvcon output is not limited by the GIL.
+    # The rippers are still created here so arguments are checked and IDs assigned up front.
     rippers = []
     futures = []
     thread_time_limit = 3600 * 5
 
-    with ThreadPoolExecutor() as ex:
+    # The info cache is held by a manager process so every ripper sees titles scanned by the others
+    with (
+        multiprocessing.Manager() as manager,
+        ProcessPoolExecutor(
+            max_workers=max(1, len(devices)),
+            initializer=init_worker,
+            initargs=(
+                logger.level,
+                multiprocessing.BoundedSemaphore(IO_JOBS),
+                manager.dict(),
+            ),
+        ) as ex,
+    ):
         for dev in devices:
             ripper = Ripper(
                 dev,
@@ -31,4 +31,9 @@ if __name__ == "__main__":
         raise FileNotFoundError("The given file was not found!")
 
     c = Container(args.filename)
-    c.split(chapter_indices=args.indices)
+
+    # Splitting at every chapter lets mkvmerge take all chapters instead of an explicit list
+    if sorted(set(args.indices)) == list(range(1, c.chapter_count + 1)):
+        c.split(all_chapters=True)
+    else:
+        c.split(chapter_indices=args.indices)